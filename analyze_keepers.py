@@ -59,19 +59,26 @@ def parse_projection_name(raw):
 
 def calculate_z_scores(df, categories, ascending_cats):
     """Z-score each category; invert for lower-is-better stats. Returns df with Total_Z."""
-    out = df.copy()
-    z_cols = []
-    for cat in categories:
-        z_col = f"z_{cat}"
-        z_cols.append(z_col)
-        if cat not in out.columns:
-            out[z_col] = 0.0
-            continue
-        mean, std = out[cat].mean(), out[cat].std()
-        out[z_col] = ((out[cat] - mean) / std) if std > 0 else 0.0
-        if cat in ascending_cats:
-            out[z_col] *= -1
-    out['Total_Z'] = out[z_cols].sum(axis=1)
+    z_cols = [f"z_{cat}" for cat in categories]
+    present = [cat in df.columns for cat in categories]
+    z = np.zeros((len(df), len(categories)), dtype=np.float64)
+    if any(present):
+        idx = [i for i, p in enumerate(present) if p]
+        arr = df[[categories[i] for i in idx]].to_numpy(dtype=np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.nanmean(arr, axis=0)
+            std = np.nanstd(arr, axis=0, ddof=1)
+        valid = np.isfinite(std) & (std > 0)
+        std[~valid] = 1.0
+        sub = (arr - mean) / std
+        sub[:, ~valid] = 0.0
+        z[:, idx] = sub
+    # Flip lower-is-better categories in one broadcast
+    z *= np.where(np.isin(categories, ascending_cats), -1.0, 1.0)
+
+    z_df = pd.DataFrame(z, index=df.index, columns=z_cols)
+    out = pd.concat([df.drop(columns=[c for c in z_cols if c in df.columns]), z_df], axis=1)
+    out['Total_Z'] = np.nansum(z, axis=1)
     return out
 
 
@@ -98,6 +105,13 @@ def fuzzy_match(name, lookup):
     return None
 
 
+def group_mode(df, key, col):
+    """Most frequent non-null `col` per `key` (ties -> smallest value). Returns a Series indexed by key."""
+    counts = df.groupby([key, col]).size().rename('_n').reset_index()
+    counts = counts.sort_values([key, '_n', col], ascending=[True, False, True], kind='mergesort')
+    return counts.drop_duplicates(key).set_index(key)[col]
+
+
 def adp_to_round(adp_rank, num_teams=10):
     """Convert ADP rank to draft round."""
     if adp_rank <= 0 or pd.isna(adp_rank):
@@ -114,26 +128,30 @@ def load_2025_stats():
     if not os.path.exists(path):
         print(f"ERROR: {path} not found"); return None
 
-    print(f"Loading 2025 stats from {os.path.basename(path)}...")
-    df = pd.read_csv(path)
-
     # Counting stats to sum
     sum_cols = ['R', 'HR', 'RBI', 'SB', 'H', 'AB', 'B_BB', 'HBP', 'SF',
                 'TB', 'PA', 'ER', 'OUTS', 'P_BB', 'P_H', 'K', 'QS', 'SVHD']
+    keep_cols = {'playerId', 'playerName', 'teamId', 'team_abbrev', 'b_or_p', *sum_cols}
+
+    print(f"Loading 2025 stats from {os.path.basename(path)}...")
+    # Daily counts are small integers (blank on off days): float32 holds them and
+    # their season sums exactly at half the width of the float64 default.
+    header = pd.read_csv(path, nrows=0).columns
+    df = pd.read_csv(path, usecols=lambda c: c in keep_cols,
+                     dtype={c: np.float32 for c in sum_cols if c in header})
     for c in sum_cols:
         if c not in df.columns:
-            df[c] = 0
-
-    agg = {
-        'playerName': 'first',
-        'teamId': lambda x: x.mode().iloc[0] if not x.mode().empty else x.iloc[-1],
-        'team_abbrev': 'last',
-        'b_or_p': lambda x: x.mode().iloc[0] if not x.mode().empty else x.iloc[0],
-    }
+            df[c] = np.float32(0)
+
+    agg = {'playerName': 'first', 'team_abbrev': 'last'}
     for c in sum_cols:
         agg[c] = 'sum'
 
     stats = df.groupby('playerId').agg(agg)
+    # Native group-mode (no per-group Python callback); ties -> smallest value like Series.mode()
+    stats['teamId'] = group_mode(df, 'playerId', 'teamId').reindex(stats.index)
+    stats['b_or_p'] = group_mode(df, 'playerId', 'b_or_p').reindex(stats.index)
+    stats = stats[['playerName', 'teamId', 'team_abbrev', 'b_or_p'] + sum_cols]
 
     # Recalculate rate stats from season totals
     stats['OBP'] = (stats['H'] + stats['B_BB'] + stats['HBP']) / stats['PA'].replace(0, np.nan)
@@ -164,7 +182,7 @@ def load_team_map():
         return {}
     tdf = pd.read_csv(path).sort_values('date')  # latest row wins
     mapping = {}
-    for _, r in tdf.iterrows():
+    for r in tdf.to_dict('records'):
         mapping[int(r['team_id'])] = {
             'name': r['team_name'], 'abbrev': r['team_abbrev'],
             'owner': r.get('team_owner_display_name', ''),
@@ -178,7 +196,7 @@ def load_projections():
     bp = os.path.join(mp.DATA_PATH, f'{DRAFT_YEAR}_ext_projections_batter.csv')
     if os.path.exists(bp):
         bdf = pd.read_csv(bp)
-        for _, r in bdf.iterrows():
+        for r in bdf.to_dict('records'):
             name = parse_projection_name(r['Player'])
             proj[name] = {
                 'type': 'batter',
@@ -189,7 +207,7 @@ def load_projections():
     pp = os.path.join(mp.DATA_PATH, f'{DRAFT_YEAR}_ext_projections_pitcher.csv')
     if os.path.exists(pp):
         pdf = pd.read_csv(pp)
-        for _, r in pdf.iterrows():
+        for r in pdf.to_dict('records'):
             name = parse_projection_name(r['Player'])
             ip = float(r.get('IP', 0))
             proj[name] = {
@@ -208,7 +226,7 @@ def load_adp():
         return {}
     adf = pd.read_csv(path)
     adp = {}
-    for _, r in adf.iterrows():
+    for r in adf.to_dict('records'):
         name = parse_projection_name(str(r.get('Player (Team)', '')))
         adp[name] = {'rank': int(r.get('Rank', 999)), 'avg': float(r.get('AVG', 999))}
     return adp
@@ -219,8 +237,8 @@ def load_draft_costs():
     path = os.path.join(mp.DATA_PATH, '2025_espn_draft_results.csv')
     if not os.path.exists(path):
         return {}
-    ddf = pd.read_csv(path)
-    return {str(r['player_id']): int(r['round']) for _, r in ddf.iterrows()}
+    ddf = pd.read_csv(path, usecols=['player_id', 'round'])
+    return dict(zip(ddf['player_id'].astype(str), ddf['round'].astype(int).tolist()))
 
 
 
@@ -235,7 +253,7 @@ def load_actual_keepers():
         return {}
     kdf = pd.read_csv(path)
     keepers = {}
-    for _, r in kdf.iterrows():
+    for r in kdf.to_dict('records'):
         tid = int(r['team_id'])
         if tid not in keepers: keepers[tid] = {}
         keepers[tid][str(r['Player']).strip()] = int(r['2026 Round'])
@@ -248,7 +266,7 @@ def load_draft_order():
         return {}
     odf = pd.read_csv(path)
     r1 = odf[odf['round'] == 1]
-    return {r['team_name'].strip(): int(r['round_pick']) for _, r in r1.iterrows()}
+    return dict(zip(r1['team_name'].str.strip(), r1['round_pick'].astype(int).tolist()))
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -279,7 +297,7 @@ def main():
     # ── 2. Cross-reference Current Rosters ─────────────────────────────
     if rosters is not None:
         roster_lookup = {}  # pid_str -> {team_id, name, position, acq}
-        for _, r in rosters.iterrows():
+        for r in rosters.to_dict('records'):
             pid = str(r['player_id'])
             roster_lookup[pid] = {
                 'team_id': int(r['team_id']),
@@ -331,13 +349,15 @@ def main():
 
     # Build projection Z-scores from projection pool
     batter_proj_list, pitcher_proj_list = [], []
-    for idx, row in all_players.iterrows():
-        proj = fuzzy_match(str(row['playerName']), projections)
+    has_proj = []
+    for idx, pname in zip(all_players.index, all_players['playerName']):
+        proj = fuzzy_match(str(pname), projections)
+        has_proj.append(bool(proj))
         if proj:
-            all_players.at[idx, 'has_proj'] = True
             entry = proj.copy()
             entry['_idx'] = idx
             (batter_proj_list if proj['type'] == 'batter' else pitcher_proj_list).append(entry)
+    all_players['has_proj'] = has_proj
 
     # Z-score batter projections as a group
     if batter_proj_list:
@@ -349,8 +369,7 @@ def main():
             else:
                 bpdf[f'z_{cat}'] = 0.0
         bpdf['_pz'] = sum(bpdf[f'z_{c}'] for c in BATTING_CATS)
-        for _, r in bpdf.iterrows():
-            all_players.at[r['_idx'], 'proj_Z'] = r['_pz']
+        all_players.loc[bpdf['_idx'], 'proj_Z'] = bpdf['_pz'].to_numpy()
 
     # Z-score pitcher projections as a group
     if pitcher_proj_list:
@@ -364,8 +383,7 @@ def main():
             else:
                 ppdf[f'z_{cat}'] = 0.0
         ppdf['_pz'] = sum(ppdf[f'z_{c}'] for c in PITCHING_CATS)
-        for _, r in ppdf.iterrows():
-            all_players.at[r['_idx'], 'proj_Z'] = r['_pz']
+        all_players.loc[ppdf['_idx'], 'proj_Z'] = ppdf['_pz'].to_numpy()
 
     # Blended Z-score
     w = PROJECTION_WEIGHT
@@ -376,20 +394,15 @@ def main():
 
     # ── 5. Add ADP + Keeper Cost + Surplus ─────────────────────────────
     print("  Calculating ADP surplus values...")
-    all_players['ADP_Rank'] = 999.0
-    all_players['ADP_Round'] = 99
-    all_players['Keeper_Cost'] = 99
-    all_players['Surplus'] = 0
-
-    for idx, row in all_players.iterrows():
-        name = str(row['playerName'])
-        tid = row.get('teamId')
+    adp_ranks, adp_rounds, keeper_costs = [], [], []
+    for idx, name, tid in zip(all_players.index, all_players['playerName'].astype(str), all_players['teamId']):
+        adp_rank, adp_round, keeper_cost = 999.0, 99, 99
 
         # ADP
         adp = fuzzy_match(name, adp_data)
         if adp:
-            all_players.at[idx, 'ADP_Rank'] = adp['avg']
-            all_players.at[idx, 'ADP_Round'] = adp_to_round(adp['rank'], num_teams)
+            adp_rank = adp['avg']
+            adp_round = adp_to_round(adp['rank'], num_teams)
 
         found_in_actual = False
         if pd.notna(tid):
@@ -397,13 +410,20 @@ def main():
             if tid_val in actual_keepers:
                 matched_cost = fuzzy_match(name, actual_keepers[tid_val])
                 if matched_cost is not None:
-                    all_players.at[idx, 'Keeper_Cost'] = matched_cost
+                    keeper_cost = matched_cost
                     found_in_actual = True
         if not found_in_actual:
             pid_str = str(idx)
             if pid_str in draft_costs:
-                all_players.at[idx, 'Keeper_Cost'] = draft_costs[pid_str]
+                keeper_cost = draft_costs[pid_str]
 
+        adp_ranks.append(adp_rank)
+        adp_rounds.append(adp_round)
+        keeper_costs.append(keeper_cost)
+
+    all_players['ADP_Rank'] = adp_ranks
+    all_players['ADP_Round'] = adp_rounds
+    all_players['Keeper_Cost'] = keeper_costs
     all_players['Surplus'] = all_players['Keeper_Cost'] - all_players['ADP_Round']
 
     # ── 6. Generate Report ─────────────────────────────────────────────
@@ -415,16 +435,15 @@ def main():
     lines.append(f"  5x5 H2H: R/HR/RBI/SB/OPS × ERA/WHIP/K9/QS/SVHD")
     lines.append("=" * 72)
 
-    all_results = []
-    teams_sorted = sorted(all_players['teamId'].unique())
+    # Sort once by team then Blend_Z; each group below is already in rank order
+    ranked = all_players.sort_values(['teamId', 'Blend_Z'], ascending=[True, False], kind='mergesort')
+    ranked['Rank'] = ranked.groupby('teamId').cumcount() + 1
+    team_info = {}
 
-    for tid in teams_sorted:
+    for tid, team_df in ranked.groupby('teamId', sort=False):
         tid = int(tid)
         info = team_map.get(tid, {'name': f'Team {tid}', 'abbrev': str(tid), 'owner': ''})
-        team_df = all_players[all_players['teamId'] == tid].copy()
-        if team_df.empty:
-            continue
-        team_df = team_df.sort_values('Blend_Z', ascending=False)
+        team_info[tid] = info
 
         # Draft order lookup
         pick_str = ""
@@ -452,7 +471,7 @@ def main():
         # Show top 8 (top 5 marked with ►)
         top5_bat, top5_pit = 0, 0
         display_count = min(8, len(team_df))
-        for rank, (idx, row) in enumerate(team_df.head(display_count).iterrows(), 1):
+        for rank, row in enumerate(team_df.head(display_count).to_dict('records'), 1):
             pos = 'BAT' if row['b_or_p'] == 'batter' else 'PIT'
             pname = str(row['playerName'])[:23]
 
@@ -483,20 +502,6 @@ def main():
             icon = "►" if rank <= NUM_KEEPERS else " "
             lines.append(f"  {icon}{rank:<2} {pname:<24} {pos:<4} {z25:>6} {pz:>6} {bz:>6} {adp_r:>5} {cost:>5} {surplus_str:>8}  {note}")
 
-        # Save ALL players to CSV (not just displayed top 8)
-        for rank, (idx, row) in enumerate(team_df.iterrows(), 1):
-            all_results.append({
-                'Team_ID': tid, 'Team': info['name'], 'Owner': info['owner'],
-                'Rank': rank, 'Player': row['playerName'], 'Type': row['b_or_p'],
-                'Z_2025': round(row['Z_2025'], 2),
-                'Proj_Z': round(row['proj_Z'], 2),
-                'Blend_Z': round(row['Blend_Z'], 2),
-                'ADP_Rank': row['ADP_Rank'],
-                'ADP_Round': int(row['ADP_Round']),
-                'Keeper_Cost': int(row['Keeper_Cost']),
-                'Surplus_Rounds': int(row['Surplus']),
-            })
-
         # Balance warning
         if top5_bat >= NUM_KEEPERS:
             lines.append(f"\n  ⚠️  Balance: {top5_bat}B / {top5_pit}P — consider swapping a batter for a pitcher")
@@ -509,8 +514,21 @@ def main():
     report = '\n'.join(lines)
     print(report)
 
-    # CSV
-    results_df = pd.DataFrame(all_results)
+    # CSV: ALL players (not just displayed top 8), built column-wise from the ranked frame
+    team_ids = ranked['teamId'].astype(int)
+    results_df = pd.DataFrame({
+        'Team_ID': team_ids,
+        'Team': team_ids.map(lambda t: team_info[t]['name']),
+        'Owner': team_ids.map(lambda t: team_info[t]['owner']),
+        'Rank': ranked['Rank'], 'Player': ranked['playerName'], 'Type': ranked['b_or_p'],
+        'Z_2025': ranked['Z_2025'].round(2),
+        'Proj_Z': ranked['proj_Z'].round(2),
+        'Blend_Z': ranked['Blend_Z'].round(2),
+        'ADP_Rank': ranked['ADP_Rank'],
+        'ADP_Round': ranked['ADP_Round'].astype(int),
+        'Keeper_Cost': ranked['Keeper_Cost'].astype(int),
+        'Surplus_Rounds': ranked['Surplus'].astype(int),
+    }).reset_index(drop=True)
     csv_path = os.path.join(mp.DATA_PATH, '2026_local_keepers_projected.csv')
     results_df.to_csv(csv_path, index=False)
     print(f"\n📊 CSV saved: {csv_path}")
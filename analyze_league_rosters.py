@@ -9,14 +9,15 @@ Description: Post-season league-wide roster management analysis. Computes the op
 Source Data: 2025_espn_roster_history.csv, 2025_mlb_stats_daily.csv, player_map.csv
 Outputs:     fantasy_baseball/reports/league_roster_analysis_2025.md (markdown + Mermaid)
 
-Notes: csv + numpy only (no pandas). Rows loaded as list[dict].
+Notes: csv + numpy only (no pandas). Stats streamed via csv.reader into numpy arrays;
+       roster history and player_map loaded as list[dict].
 """
 
 import csv
 import os
 import sys
 from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 import numpy as np
 
@@ -34,43 +35,10 @@ BATTER_STATS = ['R', 'HR', 'RBI', 'SB']
 PITCHER_POSITIVE = ['QS', 'SVHD', 'K']
 
 
-def read_csv(path):
-    with open(path, encoding='utf-8-sig', errors='replace') as f:
-        return list(csv.DictReader(f))
-
-
-def parse_date(s):
-    s = (s or '').strip()
-    if not s:
-        return None
-    for fmt in ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y'):
-        try:
-            return datetime.strptime(s[:19], fmt).date()
-        except ValueError:
-            continue
-    return None
-
-
-def to_float(v):
-    try:
-        return float(v)
-    except (TypeError, ValueError):
-        return 0.0
-
-
-def zscores(values):
-    arr = np.array(values, dtype=float)
-    mean = arr.mean()
-    std = arr.std(ddof=1) if len(arr) > 1 else 0.0
-    std = std if std else 1.0
-    return (arr - mean) / std
-
-
 def main():
     print("Loading data...")
-    roster_rows = read_csv(os.path.join(BASE_PATH, f'{SEASON}_espn_roster_history.csv'))
-    stats_rows = read_csv(os.path.join(BASE_PATH, f'{SEASON}_mlb_stats_daily.csv'))
-    map_rows = read_csv(os.path.join(BASE_PATH, 'player_map.csv'))
+    roster_rows = mp.read_csv(os.path.join(BASE_PATH, f'{SEASON}_espn_roster_history.csv'))
+    map_rows = mp.read_csv(os.path.join(BASE_PATH, 'player_map.csv'))
 
     # mlbam -> (espn_id, name)
     mlbam_to_espn = {}
@@ -80,85 +48,98 @@ def main():
         if mlbam and espn:
             mlbam_to_espn[mlbam] = (espn, (r.get('espn_name') or r.get('mlb_name') or '').strip())
 
-    # ── Parse stats, attach espn id, group by date ───────────────────────────────
-    rows_by_date = defaultdict(list)
+    # ── Stream stats: keep only bridged rows and the columns Daily_Value needs ──
+    # Signed stat columns are resolved once against the header; each kept row is a
+    # compact (date, espn_id, values) tuple instead of the full CSV dict.
+    kept = []
     max_date = None
-    for r in stats_rows:
-        d = parse_date(r.get('date'))
-        if d is None:
-            continue
-        mlbam = (r.get('playerId') or '').strip()
-        bridge = mlbam_to_espn.get(mlbam)
-        if not bridge:
-            continue
-        espn_id, name = bridge
-        r['_date'] = d
-        r['_espn_id'] = espn_id
-        r['_name'] = name or (r.get('playerName') or '')
-        rows_by_date[d].append(r)
-        if max_date is None or d > max_date:
-            max_date = d
+    with open(os.path.join(BASE_PATH, f'{SEASON}_mlb_stats_daily.csv'),
+              encoding='utf-8-sig', errors='replace') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        col = {c: i for i, c in enumerate(header)}
+        signed_cols = [(1.0, [c]) for c in BATTER_STATS + PITCHER_POSITIVE if c in col]
+        if 'P_H' in col and 'P_BB' in col:
+            signed_cols.append((-1.0, ['P_H', 'P_BB']))
+        if 'ER' in col:
+            signed_cols.append((-1.0, ['ER']))
+        # Resolve column positions once; rows are then plain lists indexed by position
+        i_pid, i_date = col.get('playerId'), col.get('date')
+        stat_idx = [[col[c] for c in cols] for _, cols in signed_cols]
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            bridge = mlbam_to_espn.get(row[i_pid].strip() if i_pid is not None else '')
+            if not bridge:
+                continue
+            d = mp.parse_date(row[i_date] if i_date is not None else None)
+            if d is None:
+                continue
+            kept.append((d, bridge[0], [sum(mp.to_float(row[i]) for i in idx) for idx in stat_idx]))
+            if max_date is None or d > max_date:
+                max_date = d
 
     # ── Per-date Daily_Value -> sum per (date, espn_id) ──────────────────────────
     print("Calculating Daily Value (league wide)...")
-    daily_value = defaultdict(float)
-    name_of = {}
-    for d, rows in rows_by_date.items():
-        contrib = np.zeros(len(rows))
-        for col in BATTER_STATS + PITCHER_POSITIVE:
-            if rows and col in rows[0]:
-                contrib += zscores([to_float(r.get(col)) for r in rows])
-        if rows and 'P_H' in rows[0] and 'P_BB' in rows[0]:
-            contrib -= zscores([to_float(r.get('P_H')) + to_float(r.get('P_BB')) for r in rows])
-        if rows and 'ER' in rows[0]:
-            contrib -= zscores([to_float(r.get('ER')) for r in rows])
-        for r, c in zip(rows, contrib):
-            daily_value[(d, r['_espn_id'])] += float(c)
-            name_of[r['_espn_id']] = r['_name']
-
-    # ── Build date x player matrix (0-filled, like pivot.fillna(0)) ──────────────
-    dates = sorted({d for (d, _) in daily_value})
-    players = sorted({p for (_, p) in daily_value})
-    date_idx = {d: i for i, d in enumerate(dates)}
-    pcol = {p: j for j, p in enumerate(players)}
-    M = np.zeros((len(dates), len(players)))
-    for (d, p), v in daily_value.items():
-        M[date_idx[d], pcol[p]] = v
+    # Sort by date once; each date is then a contiguous row block for the kernel
+    kept.sort(key=lambda r: r[0])
+    day_arr = np.array([r[0] for r in kept], dtype='datetime64[D]')
+    starts = np.flatnonzero(np.r_[True, day_arr[1:] != day_arr[:-1]]) if len(kept) else np.zeros(0, int)
+    X = np.array([r[2] for r in kept], dtype=float).reshape(len(kept), len(signed_cols))
+    signs = np.array([sign for sign, _ in signed_cols], dtype=float)
+    contrib = mp.grouped_zscores(X, starts) @ signs
+
+    # ── Scatter straight into the date x player matrix (0-filled, like pivot.fillna(0))
+    dates = day_arr[starts]
+    date_code = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, len(kept))))
+    players, player_code = np.unique(np.array([r[1] for r in kept], dtype=str), return_inverse=True)
+    pcol = {p: j for j, p in enumerate(players.tolist())}
+    # Stored as float32 (halves the matrix); sums below accumulate in float64.
+    M = np.zeros((len(dates), len(players)), dtype=np.float32)
+    np.add.at(M, (date_code, player_code), contrib.astype(np.float32))
     n_dates = len(dates)
 
+    # Cumulative sums once; every trailing window mean is a difference of two rows
+    csum = np.vstack([np.zeros((1, M.shape[1])), np.cumsum(M, axis=0, dtype=np.float64)])
+
     def rolling_mean(window):
         """[date,player] trailing mean of `window` rows; NaN before enough rows."""
         out = np.full(M.shape, np.nan)
-        csum = np.cumsum(M, axis=0)
-        for i in range(n_dates):
-            if i >= window - 1:
-                prev = csum[i - window] if i - window >= 0 else 0
-                out[i] = (csum[i] - prev) / window
+        if window <= n_dates:
+            out[window - 1:] = (csum[window:] - csum[:-window]) / window
         return out
 
     # ── Optimal evaluation window (3..90) vs next-7-day performance ──────────────
     print("Calculating Optimal Evaluation Window (3-90 days)...")
     roll7 = rolling_mean(7)
     future_7 = np.full(M.shape, np.nan)        # future_7[i] = mean(next 7 days) = roll7[i+7]
-    for i in range(n_dates):
-        if i + 7 < n_dates:
-            future_7[i] = roll7[i + 7]
+    if n_dates > 7:
+        future_7[:n_dates - 7] = roll7[7:]
 
-    windows = list(range(3, 91, 3))
-    correlations = {}
-    for w in windows:
-        past_w = rolling_mean(w)
+    def eval_window(w):
+        """Pearson r between the trailing-`w` mean and the next-7-day mean."""
         lo, hi = w - 1, n_dates - 8           # rows where both past_w and future_7 exist
         if hi < lo:
-            correlations[w] = float('nan')
-            continue
-        past_vals = past_w[lo:hi + 1].ravel()
-        fut_vals = future_7[lo:hi + 1].ravel()
-        mask = ~np.isnan(past_vals) & ~np.isnan(fut_vals)
-        if mask.sum() < 2 or np.std(past_vals[mask]) == 0 or np.std(fut_vals[mask]) == 0:
-            correlations[w] = float('nan')
-        else:
-            correlations[w] = float(np.corrcoef(past_vals[mask], fut_vals[mask])[0, 1])
+            return float('nan')
+        # No NaN mask is needed only because M is 0-filled (missing player-days are 0,
+        # like pivot.fillna(0)): inside [lo, hi] both sides are then always finite.
+        # If M ever keeps NaN for missing days, this must mask them out again.
+        past_vals = (csum[lo + 1:hi + 2] - csum[lo + 1 - w:hi + 2 - w]) / w
+        fut_vals = future_7[lo:hi + 1]
+        if past_vals.size < 2:
+            return float('nan')
+        # Pearson r from centered sums (raw n*sxx - sx*sx loses precision on large values)
+        dx = past_vals - past_vals.mean()
+        dy = fut_vals - fut_vals.mean()
+        var_x, var_y = np.einsum('ij,ij->', dx, dx), np.einsum('ij,ij->', dy, dy)
+        if var_x <= 0 or var_y <= 0:
+            return float('nan')
+        return float(np.einsum('ij,ij->', dx, dy) / np.sqrt(var_x * var_y))
+
+    correlations = {w: eval_window(w) for w in range(3, 91, 3)}
 
     valid_corrs = {w: c for w, c in correlations.items() if not np.isnan(c)}
     max_corr = max(valid_corrs.values())
@@ -175,14 +156,14 @@ def main():
     rosters = []
     season_start = None
     for r in roster_rows:
-        sd = parse_date(r.get('start_date'))
-        ed = parse_date(r.get('end_date')) or max_date
+        sd = mp.parse_date(r.get('start_date'))
+        ed = mp.parse_date(r.get('end_date')) or max_date
         if sd is None:
             continue
         rosters.append({
             'team_abbrev': (r.get('team_abbrev') or '').strip(),
             'player_id': (r.get('player_id') or '').strip(),
-            'days_held': to_float(r.get('days_held')),
+            'days_held': mp.to_float(r.get('days_held')),
             'start_date': sd, 'end_date': ed,
         })
         if season_start is None or sd < season_start:
@@ -217,20 +198,21 @@ def main():
 
     # ── Team success (total value over active roster-days) ───────────────────────
     print("Calculating Team Success...")
-    team_values = defaultdict(float)
     teams = sorted({r['team_abbrev'] for r in rosters})
-    for t in teams:
-        team_values[t] = 0.0
     n_days = (max_date - season_start).days + 1
-    day = season_start
-    while day <= max_date:
-        di = date_idx.get(day)
-        active = [r for r in rosters if r['start_date'] <= day <= r['end_date']]
-        for r in active:
-            j = pcol.get(r['player_id'])
-            if di is not None and j is not None:
-                team_values[r['team_abbrev']] += M[di, j]
-        day += timedelta(days=1)
+    # All roster spans at once: searchsorted bounds into the date axis, then a
+    # span's value is csum[hi, j] - csum[lo, j], summed per team with bincount.
+    team_code = {t: k for k, t in enumerate(teams)}
+    spans = [(team_code[r['team_abbrev']], pcol[r['player_id']], r['start_date'], r['end_date'])
+             for r in rosters if r['player_id'] in pcol]
+    team_tot = np.zeros(len(teams))
+    if spans:
+        t_idx, j_idx, sd_arr, ed_arr = (np.array(c) for c in zip(*spans))
+        lo = np.searchsorted(dates, np.maximum(sd_arr.astype('datetime64[D]'), np.datetime64(season_start)), 'left')
+        hi = np.searchsorted(dates, np.minimum(ed_arr.astype('datetime64[D]'), np.datetime64(max_date)), 'right')
+        span_vals = np.where(hi > lo, csum[hi, j_idx] - csum[lo, j_idx], 0.0)
+        team_tot = np.bincount(t_idx, weights=span_vals, minlength=len(teams))
+    team_values = {t: float(team_tot[k]) for t, k in team_code.items()}
 
     # ── Combine metrics ──────────────────────────────────────────────────────────
     metrics = {}
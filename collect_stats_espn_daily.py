@@ -37,9 +37,9 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
 from espn_api.baseball import League
-from espn_api.baseball.constant import POSITION_MAP, PRO_TEAM_MAP, STATS_MAP
+from espn_api.baseball.constant import POSITION_MAP, PRO_TEAM_MAP
 from fantasy_baseball.mlb_processing import (
-    load_config, setup_league, DATA_PATH, date_to_scoring_period,
+    load_config, setup_league, DATA_PATH, date_to_scoring_period, STATS_MAP_BY_KEY,
 )
 
 # ---------------------------------------------------------------------------
@@ -48,6 +48,15 @@ from fantasy_baseball.mlb_processing import (
 # Lineup slot IDs that indicate a pitcher
 PITCHER_SLOT_IDS = {13, 14, 15}   # P, SP, RP
 
+# Stable leading CSV columns; stat columns follow alphabetically
+FIXED_COLS = [
+    'date', 'scoring_period', 'team_id', 'team_name', 'team_abbrev',
+    'player_id', 'player_name', 'player_position', 'player_type',
+    'lineup_slot', 'injury_status', 'injured', 'pro_team',
+    'eligible_slots', 'acquisition_type', 'points',
+]
+_FIXED_COL_SET = frozenset(FIXED_COLS)
+
 
 
 
@@ -150,9 +159,9 @@ def _extract_entry(
             if sp_id == scoring_period_id and stat_source == 0:
                 row['points'] = stat_block.get('appliedTotal', 0)
                 for stat_id_str, stat_val in stat_block.get('stats', {}).items():
-                    stat_id = int(stat_id_str)
-                    if stat_id in STATS_MAP:
-                        row[STATS_MAP[stat_id]] = stat_val
+                    stat_name = STATS_MAP_BY_KEY.get(stat_id_str)
+                    if stat_name is not None:
+                        row[stat_name] = stat_val
                 break
 
     return row
@@ -284,29 +293,25 @@ def load_existing_keys(csv_path):
     return keys
 
 
-def append_rows(csv_path, rows, existing_keys):
+def append_rows(csv_path, rows, existing_keys, fieldnames=None):
     """
     Append *new* rows to the CSV, skipping any whose (date, team_id, player_id)
     key already exists.  Creates the file with a header if it doesn't exist.
 
+    Pass `fieldnames` when the caller already knows the columns to skip the
+    scan of every row's keys.
+
     Returns the count of rows actually written.
     """
     if not rows:
         return 0
 
-    # Build the canonical column order from the first row + any extras
-    # We want a stable column order: fixed columns first, then stats alphabetically.
-    fixed_cols = [
-        'date', 'scoring_period', 'team_id', 'team_name', 'team_abbrev',
-        'player_id', 'player_name', 'player_position', 'player_type',
-        'lineup_slot', 'injury_status', 'injured', 'pro_team',
-        'eligible_slots', 'acquisition_type', 'points',
-    ]
-    # Gather any stat columns that appeared across all rows
-    stat_cols = set()
-    for r in rows:
-        stat_cols.update(k for k in r.keys() if k not in fixed_cols)
-    all_cols = fixed_cols + sorted(stat_cols)
+    # Stable column order: fixed columns first, then stats alphabetically.
+    if fieldnames is None:
+        # Union of stat columns across all rows (first-seen dict, then sorted)
+        stat_cols = dict.fromkeys(k for r in rows for k in r if k not in _FIXED_COL_SET)
+        fieldnames = FIXED_COLS + sorted(stat_cols)
+    all_cols = list(fieldnames)
 
     # If file already exists, read its header to stay consistent
     file_exists = os.path.exists(csv_path) and os.path.getsize(csv_path) > 0
@@ -315,7 +320,8 @@ def append_rows(csv_path, rows, existing_keys):
             reader = csv.DictReader(f)
             existing_cols = reader.fieldnames or []
         # Merge: keep existing order, append any new stat columns
-        new_stat_cols = [c for c in all_cols if c not in existing_cols]
+        seen = set(existing_cols)
+        new_stat_cols = [c for c in all_cols if c not in seen]
         if new_stat_cols:
             # Need to rewrite header — rare edge case when new stats appear
             all_cols = existing_cols + new_stat_cols
@@ -394,11 +400,7 @@ def main():
 
         if last_recorded is not None and last_recorded < end_date:
             start_date = last_recorded + timedelta(days=1)
-            dates = []
-            cur = start_date
-            while cur <= end_date:
-                dates.append(cur)
-                cur += timedelta(days=1)
+            dates = [start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)]
         else:
             dates = [yesterday] if datetime.now().hour < 12 else [yesterday, today]
 
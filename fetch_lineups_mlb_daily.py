@@ -22,6 +22,7 @@ Usage:
 import os
 import sys
 import csv
+import io
 import time
 import argparse
 from datetime import datetime, date, timedelta
@@ -69,34 +70,34 @@ def append_rows(csv_path: str, rows: list, existing_keys: set,
     if not rows:
         return 0
 
-    # Determine full column list
-    all_cols = list(fixed_cols)  # copy
-    for r in rows:
-        for k in r.keys():
-            if k not in all_cols:
-                all_cols.append(k)
+    # Determine full column list (first-seen order; one hash insert per key)
+    all_cols = list(dict.fromkeys([*fixed_cols, *(k for r in rows for k in r)]))
 
     file_exists = os.path.exists(csv_path) and os.path.getsize(csv_path) > 0
     if file_exists:
         with open(csv_path, 'r', newline='', encoding='utf-8') as f:
             existing_cols = csv.DictReader(f).fieldnames or []
         # Merge: keep existing order, append any new cols
-        new_cols = [c for c in all_cols if c not in existing_cols]
+        seen = set(existing_cols)
+        new_cols = [c for c in all_cols if c not in seen]
         all_cols = existing_cols + new_cols
 
+    # Render the batch in memory, then hand it to the file in a single write
     written = 0
-    mode = 'a' if file_exists else 'w'
-    with open(csv_path, mode, newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=all_cols, extrasaction='ignore')
-        if not file_exists:
-            writer.writeheader()
-        for r in rows:
-            key = key_fn(r)
-            if key in existing_keys:
-                continue
-            writer.writerow(r)
-            existing_keys.add(key)
-            written += 1
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=all_cols, extrasaction='ignore')
+    if not file_exists:
+        writer.writeheader()
+    for r in rows:
+        key = key_fn(r)
+        if key in existing_keys:
+            continue
+        writer.writerow(r)
+        existing_keys.add(key)
+        written += 1
+    if written or not file_exists:
+        with open(csv_path, 'a' if file_exists else 'w', newline='', encoding='utf-8') as f:
+            f.write(buf.getvalue())
     return written
 
 
@@ -177,11 +178,7 @@ def main():
             print(f'{tag} fetch_lineups_mlb_daily: already current through {end_date}, nothing to do')
             return
 
-        dates_to_fetch = []
-        d = start
-        while d <= end_date:
-            dates_to_fetch.append(d)
-            d += timedelta(days=1)
+        dates_to_fetch = [start + timedelta(days=i) for i in range((end_date - start).days + 1)]
 
         for i, d in enumerate(dates_to_fetch):
             total_written += fetch_date(d.strftime('%Y-%m-%d'), batter_path, existing_keys, dry_run=args.dry_run)
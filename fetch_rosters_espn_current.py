@@ -37,7 +37,7 @@ def main():
     os.makedirs(mp.DATA_PATH, exist_ok=True)
     save_path = os.path.join(mp.DATA_PATH, f"{year}_espn_roster_season.csv")
 
-    fieldnames = list({k for r in rosters for k in r.keys()})
+    fieldnames = list(dict.fromkeys(k for r in rosters for k in r))
     preferred_order = ['date', 'team_id', 'team_name', 'player_id', 'player_name',
                        'lineup_slot', 'injuryStatus', 'eligibleSlots']
     ordered = [c for c in preferred_order if c in fieldnames] + \
@@ -41,7 +41,7 @@ def main():
 
     os.makedirs(mp.DATA_PATH, exist_ok=True)
     save_path = os.path.join(mp.DATA_PATH, f"{year}_espn_scoreboard_matchup.csv")
-    fieldnames = list({k for r in scoreboard_data for k in r.keys()})
+    fieldnames = list(dict.fromkeys(k for r in scoreboard_data for k in r))
     with open(save_path, 'w', encoding='utf-8', newline='') as f:
         w = csv.DictWriter(f, fieldnames=fieldnames)
         w.writeheader()
@@ -2,11 +2,14 @@ import os
 import sys
 import pandas as pd
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from fantasy_baseball import mlb_processing as mp
 
+MAX_WORKERS = 16  # concurrent scoring-period requests to ESPN
+
 def main():
     target_year = int(sys.argv[1]) if len(sys.argv) > 1 else 2025
     print(f"--- Starting Daily Stats Update for {target_year} ---")
@@ -41,9 +44,13 @@ def main():
     # 4. Fetch Data
     print("Fetching daily player stats (this may take a while)...")
     try:
-        # Pass the simple list to fetch_league_matchup_data
-        # It will iterate each SP without filtering by matchup_period
-        data, team_map = mp.fetch_league_matchup_data(league, daily_scoring_periods)
+        # Each SP is an independent blocking ESPN request: fan them out over a thread
+        # pool (no matchup_period filter). map() keeps results in SP order.
+        team_map = {t.team_id: t.team_abbrev for t in league.teams}
+        data = []
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+            for rows in ex.map(lambda sp: mp.fetch_scoring_period_data(league, sp), daily_scoring_periods):
+                data.extend(rows)
         print(f"Fetched {len(data)} records.")
         
     except Exception as e:
@@ -13,11 +13,11 @@ Outputs: data-lake/01_Bronze/fantasy_baseball/{year}_mlb_stats_daily.csv
          Deduplicates on (date, player_id, b_or_p). Safe to re-run.
 """
 
-import requests
-import time
 import csv
+import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 
 # Add project root to path
@@ -27,110 +27,113 @@ from fantasy_baseball import mlb_processing as mp
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
 }
+MAX_WORKERS = 8  # concurrent gameLog requests to statsapi.mlb.com
+GAME_LOG_CACHE_DIR = os.path.join(mp.DATA_PATH, 'cache', 'mlb_game_logs')
+
+# Fixed row templates: process_*_log always emit exactly these keys, so the output
+# header is known up front instead of being unioned from every row.
+ID_COLUMNS = ['date', 'scoring_period', 'player_id', 'player_name', 'team_id', 'team_name', 'opponent_id', 'is_home', 'game_id', 'b_or_p']
+HITTING_COLUMNS = ID_COLUMNS + ['G', 'AB', 'R', 'H', '2B', '3B', 'HR', 'RBI', 'SB', 'CS', 'B_BB', 'SO', 'HBP', 'SF', 'TB']
+PITCHING_COLUMNS = ID_COLUMNS + ['G', 'GS', 'W', 'L', 'QS', 'SV', 'HLD', 'SVHD', 'OUTS', 'P_H', 'P_R', 'ER', 'P_HR', 'P_BB', 'K']
+OUTPUT_COLUMNS = ID_COLUMNS + sorted(set(HITTING_COLUMNS + PITCHING_COLUMNS) - set(ID_COLUMNS))
 
 def fetch_game_logs(player_id, group, season):
-    """Fetch game logs for a player. Returns (splits, error_msg) — error_msg is None on success."""
+    """Fetch game logs for a player. Returns (splits, error_msg) — error_msg is None on success.
+
+    Completed seasons are immutable, so their logs are cached on disk under
+    GAME_LOG_CACHE_DIR and served from there on reruns without a request.
+    """
+    cache_path = None
+    if season < date.today().year:
+        cache_path = os.path.join(GAME_LOG_CACHE_DIR, str(season), group, f'{player_id}.json')
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    return mp._json_loads(f.read()), None
+            except (OSError, ValueError):
+                pass  # unreadable cache file: treat as a miss, re-fetch and rewrite it
+
     url = f"https://statsapi.mlb.com/api/v1/people/{player_id}/stats?stats=gameLog&season={season}&group={group}"
     try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
+        # mlb_processing's pooled keep-alive session: the ~3000 gameLog calls reuse TLS connections
+        response = mp._SESSION.get(url, headers=HEADERS, timeout=10)
         if response.status_code == 200:
-            return response.json().get('stats', [{}])[0].get('splits', []), None
+            splits = mp._json_loads(response.content).get('stats', [{}])[0].get('splits', [])
+            if cache_path:
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                tmp_path = cache_path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(splits, f)
+                os.replace(tmp_path, cache_path)
+            return splits, None
         else:
-            print(f"  Error fetching logs for {player_id}: Status {response.status_code}")
             return [], f"HTTP {response.status_code}"
     except Exception as e:
-        print(f"  Exception fetching logs for {player_id}: {e}")
         return [], str(e)
 
-def process_hitting_log(log, player_info, get_scoring_period_fn=None):
-    """Process a single hitting game log."""
-    stat = log.get('stat', {})
-    game = log.get('game', {})
+def fetch_all_game_logs(items, group, season, max_workers=MAX_WORKERS):
+    """Fetch game logs for many (player_id, name) items concurrently.
 
-    date_str = log.get('date', '1900-01-01')
+    Yields (splits, error_msg) in the same order as `items`, as soon as each is
+    ready. The bounded worker pool stands in for the old per-request sleep as the
+    rate limit.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        yield from ex.map(lambda item: fetch_game_logs(item[0], group, season), items)
 
-    row = {
+def _base_row(log, player_info, b_or_p, get_scoring_period_fn):
+    """Identity/game columns shared by hitting and pitching rows."""
+    date_str = log.get('date', '1900-01-01')
+    team = log.get('team', {})
+    return {
         'date': date_str,
         'scoring_period': get_scoring_period_fn(date_str) if get_scoring_period_fn else 0,
         'player_id': player_info['id'],
         'player_name': player_info['name'],
-        'team_id': log.get('team', {}).get('id'),
-        'team_name': log.get('team', {}).get('name'),
+        'team_id': team.get('id'),
+        'team_name': team.get('name'),
         'opponent_id': log.get('opponent', {}).get('id'),
         'is_home': log.get('isHome', False),
-        'game_id': game.get('gamePk'),
-        'b_or_p': 'batter',
+        'game_id': log.get('game', {}).get('gamePk'),
+        'b_or_p': b_or_p,
         'G': 1,
-        'AB': stat.get('atBats', 0),
-        'R': stat.get('runs', 0),
-        'H': stat.get('hits', 0),
-        '2B': stat.get('doubles', 0),
-        '3B': stat.get('triples', 0),
-        'HR': stat.get('homeRuns', 0),
-        'RBI': stat.get('rbi', 0),
-        'SB': stat.get('stolenBases', 0),
-        'CS': stat.get('caughtStealing', 0),
-        'B_BB': stat.get('baseOnBalls', 0),
-        'SO': stat.get('strikeOuts', 0),
-        'HBP': stat.get('hitByPitch', 0),
-        'SF': stat.get('sacFlies', 0),
-        'TB': stat.get('totalBases', 0),
     }
+
+# Output column -> MLB Stats API stat field (default 0)
+HITTING_STAT_FIELDS = (
+    ('AB', 'atBats'), ('R', 'runs'), ('H', 'hits'), ('2B', 'doubles'), ('3B', 'triples'),
+    ('HR', 'homeRuns'), ('RBI', 'rbi'), ('SB', 'stolenBases'), ('CS', 'caughtStealing'),
+    ('B_BB', 'baseOnBalls'), ('SO', 'strikeOuts'), ('HBP', 'hitByPitch'), ('SF', 'sacFlies'),
+    ('TB', 'totalBases'),
+)
+PITCHING_STAT_FIELDS = (
+    ('GS', 'gamesStarted'), ('W', 'wins'), ('L', 'losses'), ('SV', 'saves'), ('HLD', 'holds'),
+    ('P_H', 'hits'), ('P_R', 'runs'), ('ER', 'earnedRuns'), ('P_HR', 'homeRuns'),
+    ('P_BB', 'baseOnBalls'), ('K', 'strikeOuts'),
+)
+
+def process_hitting_log(log, player_info, get_scoring_period_fn=None):
+    """Process a single hitting game log."""
+    stat = log.get('stat', {})
+    row = _base_row(log, player_info, 'batter', get_scoring_period_fn)
+    row.update({col: stat.get(field, 0) for col, field in HITTING_STAT_FIELDS})
     return row
 
 def process_pitching_log(log, player_info, get_scoring_period_fn=None):
     """Process a single pitching game log."""
     stat = log.get('stat', {})
-    game = log.get('game', {})
-
-    date_str = log.get('date', '1900-01-01')
-
-    # Calculate IP as outs
-    ip_str = str(stat.get('inningsPitched', '0.0'))
-    if '.' in ip_str:
-        innings, partial = ip_str.split('.')
-        outs = int(innings) * 3 + int(partial)
-    else:
-        outs = int(ip_str) * 3
-        
-    # QS Calculation
-    # start = 1 if gamesStarted > 0
-    gs = stat.get('gamesStarted', 0)
-    er = stat.get('earnedRuns', 0)
-    is_qs = 1 if (gs == 1 and outs >= 18 and er <= 3) else 0 # 18 outs = 6.0 IP
-    
-    # SVHD
-    sv = stat.get('saves', 0)
-    hld = stat.get('holds', 0)
-    svhd = sv + hld
-    
-    row = {
-        'date': date_str,
-        'scoring_period': get_scoring_period_fn(date_str) if get_scoring_period_fn else 0,
-        'player_id': player_info['id'],
-        'player_name': player_info['name'],
-        'team_id': log.get('team', {}).get('id'),
-        'team_name': log.get('team', {}).get('name'),
-        'opponent_id': log.get('opponent', {}).get('id'),
-        'is_home': log.get('isHome', False),
-        'game_id': game.get('gamePk'),
-        'b_or_p': 'pitcher',
-        'G': 1,
-        'GS': gs,
-        'W': stat.get('wins', 0),
-        'L': stat.get('losses', 0),
-        'QS': is_qs,
-        'SV': sv,
-        'HLD': hld,
-        'SVHD': svhd,
-        'OUTS': outs,
-        'P_H': stat.get('hits', 0),
-        'P_R': stat.get('runs', 0),
-        'ER': er,
-        'P_HR': stat.get('homeRuns', 0),
-        'P_BB': stat.get('baseOnBalls', 0),
-        'K': stat.get('strikeOuts', 0),
-    }
+    row = _base_row(log, player_info, 'pitcher', get_scoring_period_fn)
+    row.update({col: stat.get(field, 0) for col, field in PITCHING_STAT_FIELDS})
+
+    # Calculate IP as outs: the tenths digit of "6.2" counts outs (0-2), not a fraction
+    ip = float(stat.get('inningsPitched') or 0)
+    whole = int(ip)
+    outs = whole * 3 + round((ip - whole) * 10)
+    row['OUTS'] = outs
+
+    # QS: a start of 6.0+ IP (18 outs) with 3 or fewer ER
+    row['QS'] = 1 if (row['GS'] == 1 and outs >= 18 and row['ER'] <= 3) else 0
+    row['SVHD'] = row['SV'] + row['HLD']
     return row
 
 
@@ -160,7 +163,13 @@ def main():
     output_file = os.path.join(mp.DATA_PATH, f'{season}_mlb_stats_daily.csv')
     season_start = date(season, 3, 23)
 
+    # Every in-season date precomputed once; the strptime path only runs for odd inputs
+    sp_map = {(season_start + timedelta(days=d)).isoformat(): d + 1 for d in range(240)}
+
     def get_scoring_period_local(game_date_str):
+        sp = sp_map.get(game_date_str)
+        if sp is not None:
+            return sp
         try:
             game_date = datetime.strptime(game_date_str, '%Y-%m-%d').date()
             days_diff = (game_date - season_start).days
@@ -168,21 +177,28 @@ def main():
         except ValueError:
             return 0
 
-    # Load existing CSV to determine start date and dedup keys
+    # Scan existing CSV for start date and dedup keys (rows themselves are not kept;
+    # new rows are appended to the file as each player is processed)
     existing_keys = set()
-    existing_rows = []
     existing_headers = None
     start_date = f'{season}-03-23'
 
     if os.path.exists(output_file):
-        with open(output_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            existing_headers = reader.fieldnames
-            for row in reader:
-                existing_rows.append(row)
-                existing_keys.add((row['date'], str(row['player_id']), row['b_or_p']))
-        if existing_rows:
-            last_date = max(r['date'] for r in existing_rows)
+        last_date = None
+        # Key-only scan: plain csv.reader + column indices, no per-row dict
+        with open(output_file, 'r', newline='', encoding='utf-8-sig') as f:
+            reader = csv.reader(f)
+            existing_headers = next(reader, None)
+            if existing_headers:
+                i_date, i_pid, i_bp = (existing_headers.index(c) for c in ('date', 'player_id', 'b_or_p'))
+                for row in reader:
+                    if not row:
+                        continue
+                    d = row[i_date]
+                    existing_keys.add((d, row[i_pid], row[i_bp]))
+                    if last_date is None or d > last_date:
+                        last_date = d
+        if last_date is not None:
             start_date = last_date  # one day overlap, dedup handles it
     hitting_players = mp.scrape_mlb_stats("hitting", season, "ALL")
     pitching_players = mp.scrape_mlb_stats("pitching", season, "ALL")
@@ -190,43 +206,56 @@ def main():
     unique_hitters = {p['player_id']: p['player_name'] for p in hitting_players if p['player_id']}
     unique_pitchers = {p['player_id']: p['player_name'] for p in pitching_players if p['player_id']}
 
-    new_rows = []
+    new_row_count = 0
     skipped_players = []
     run_date = date.today().strftime('%Y-%m-%d')
 
     hitters_items = list(unique_hitters.items())
-    if limit:
-        hitters_items = hitters_items[:limit]
-
-    for pid, name in hitters_items:
-        logs, err = fetch_game_logs(pid, "hitting", season)
-        if err is not None:
-            skipped_players.append({'date_ran': run_date, 'player_id': pid, 'player_name': name, 'group': 'hitting', 'error': err})
-        for log in logs:
-            row = process_hitting_log(log, {'id': pid, 'name': name}, get_scoring_period_local)
-            if start_date <= row['date'] <= target_date:
-                key = (row['date'], str(row['player_id']), row['b_or_p'])
-                if key not in existing_keys:
-                    new_rows.append(row)
-                    existing_keys.add(key)
-        time.sleep(0.5)
-
     pitchers_items = list(unique_pitchers.items())
     if limit:
+        hitters_items = hitters_items[:limit]
         pitchers_items = pitchers_items[:limit]
 
-    for pid, name in pitchers_items:
-        logs, err = fetch_game_logs(pid, "pitching", season)
-        if err is not None:
-            skipped_players.append({'date_ran': run_date, 'player_id': pid, 'player_name': name, 'group': 'pitching', 'error': err})
-        for log in logs:
-            row = process_pitching_log(log, {'id': pid, 'name': name}, get_scoring_period_local)
-            if start_date <= row['date'] <= target_date:
-                key = (row['date'], str(row['player_id']), row['b_or_p'])
-                if key not in existing_keys:
-                    new_rows.append(row)
-                    existing_keys.add(key)
-        time.sleep(0.5)
+    out_f = writer = None
+    try:
+        for group, items, process_log in (("hitting", hitters_items, process_hitting_log),
+                                          ("pitching", pitchers_items, process_pitching_log)):
+            results = fetch_all_game_logs(items, group, season)
+            n_failed = len(skipped_players)
+            for (pid, name), (logs, err) in zip(items, results):
+                if err is not None:
+                    skipped_players.append({'date_ran': run_date, 'player_id': pid, 'player_name': name, 'group': group, 'error': err})
+                player_rows = []
+                for log in logs:
+                    row = process_log(log, {'id': pid, 'name': name}, get_scoring_period_local)
+                    if start_date <= row['date'] <= target_date:
+                        key = (row['date'], str(row['player_id']), row['b_or_p'])
+                        if key not in existing_keys:
+                            player_rows.append(row)
+                            existing_keys.add(key)
+                if not player_rows:
+                    continue
+                new_row_count += len(player_rows)
+                if args.dry_run:
+                    continue
+                # Stream each player's rows straight to disk; open lazily on first write.
+                if writer is None:
+                    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                    out_f = open(output_file, 'a' if existing_headers else 'w', newline='', encoding='utf-8')
+                    writer = csv.DictWriter(out_f, fieldnames=existing_headers or OUTPUT_COLUMNS, extrasaction='ignore')
+                    if not existing_headers:
+                        writer.writeheader()
+                writer.writerows(player_rows)
+            # Failures are reported once per group from the main thread rather than
+            # printed from inside the worker pool as they happen.
+            n_failed = len(skipped_players) - n_failed
+            if n_failed:
+                errors = ", ".join(f"{r['player_id']} ({r['error']})" for r in skipped_players[-n_failed:][:5])
+                more = f", +{n_failed - 5} more" if n_failed > 5 else ""
+                print(f"  [!] {group}: {n_failed}/{len(items)} game-log fetches failed: {errors}{more}")
+    finally:
+        if out_f is not None:
+            out_f.close()
 
     # Write skipped players log
     skipped_file = os.path.join(mp.DATA_PATH, f'{season}_mlb_stats_daily_skipped.csv')
@@ -235,37 +264,25 @@ def main():
         existing_skipped = []
         existing_skipped_keys = set()
         if os.path.exists(skipped_file):
-            with open(skipped_file, 'r', encoding='utf-8') as f:
+            with open(skipped_file, 'r', newline='', encoding='utf-8-sig') as f:
                 for row in csv.DictReader(f):
                     existing_skipped.append(row)
                     existing_skipped_keys.add((row['date_ran'], str(row['player_id']), row['group']))
         new_skipped = [r for r in skipped_players if (r['date_ran'], str(r['player_id']), r['group']) not in existing_skipped_keys]
-        with open(skipped_file, 'w', newline='', encoding='utf-8') as f:
+        # Full rewrite: go through a temp file so an interrupted run can't truncate the log
+        tmp_file = skipped_file + '.tmp'
+        with open(tmp_file, 'w', newline='', encoding='utf-8') as f:
             writer = csv.DictWriter(f, fieldnames=skipped_headers)
             writer.writeheader()
             writer.writerows(existing_skipped)
             writer.writerows(new_skipped)
+        os.replace(tmp_file, skipped_file)
 
     tag = "[DRY-RUN]" if args.dry_run else "[OK]   "
     verb = "would write" if args.dry_run else "rows written"
 
-    if new_rows and not args.dry_run:
-        all_keys = set()
-        for r in existing_rows + new_rows:
-            all_keys.update(r.keys())
-        ordered_keys = ['date', 'scoring_period', 'player_id', 'player_name', 'team_id', 'team_name', 'opponent_id', 'is_home', 'game_id', 'b_or_p']
-        remaining = [k for k in all_keys if k not in ordered_keys]
-        final_headers = existing_headers if existing_headers else (ordered_keys + sorted(remaining))
-
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=final_headers, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(existing_rows)
-            writer.writerows(new_rows)
-
     skipped_note = f" | {len(skipped_players)} skipped" if skipped_players else ""
-    print(f"{tag} fetch_stats_mlb_daily: {len(new_rows)} {verb} | {start_date} → {target_date} | {len(unique_hitters)} hitters, {len(unique_pitchers)} pitchers{skipped_note}")
+    print(f"{tag} fetch_stats_mlb_daily: {new_row_count} {verb} | {start_date} → {target_date} | {len(unique_hitters)} hitters, {len(unique_pitchers)} pitchers{skipped_note}")
 
 if __name__ == "__main__":
     main()
@@ -51,6 +51,7 @@ Outputs:
                normalized_name, b_or_p, primary_position, eligible_slots, pro_team,
                id_source, seen_in, first_seen_year, last_seen_year, last_verified_date
     - data-lake/00_Logs/fantasy_baseball/generate_player_map_{DATE}.log
+    - data-lake/01_Bronze/fantasy_baseball/cache/people_search.json (people/search hits, reused for SEARCH_CACHE_TTL_DAYS)
 
 Usage:
     python generate_player_map.py            # full build (calls all three systems)
@@ -75,7 +76,9 @@ import urllib.error
 import urllib.parse
 import urllib.request
 from collections import defaultdict
-from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import lru_cache
 
 # ── Paths ─────────────────────────────────────────────────────────────────────
 REPO = r"C:\Users\peter.rigali\Desktop\acn_repo"
@@ -83,6 +86,8 @@ BASE = os.path.join(REPO, "data-lake", "01_Bronze", "fantasy_baseball")
 LOG_DIR = os.path.join(REPO, "data-lake", "00_Logs", "fantasy_baseball")
 OUT_PATH = os.path.join(BASE, "player_map.csv")
 ESPN_REF_PATH = os.path.join(BASE, "espn_player_universe.csv")
+SEARCH_CACHE_PATH = os.path.join(BASE, "cache", "people_search.json")
+SEARCH_CACHE_TTL_DAYS = 7  # re-query cached names after this, so debuting namesakes are picked up
 
 FIRST_YEAR = 2023
 CURRENT_YEAR = date.today().year
@@ -94,7 +99,7 @@ FIELDNAMES = [
     "last_verified_date",
 ]
 
-_SUFFIXES = (" jr.", " sr.", " ii", " iii", " iv")
+_SUFFIXES = frozenset({"jr.", "sr.", "ii", "iii", "iv"})  # trailing name tokens to drop
 _USER_AGENT = {"User-Agent": "Mozilla/5.0"}
 
 _log_lines = []
@@ -107,18 +112,23 @@ def log(msg=""):
 
 # ── Name normalization (shared with the old lookup so coverage is comparable) ──
 def strip_accents(s):
+    s = s or ""
+    if s.isascii():  # nothing to decompose -- skip the per-character category scan
+        return s.lower().strip()
     return "".join(
-        c for c in unicodedata.normalize("NFD", s or "")
+        c for c in unicodedata.normalize("NFD", s)
         if unicodedata.category(c) != "Mn"
     ).lower().strip()
 
 
+# Memoized: the same names recur across every season of people/search results,
+# each data-lake file and the ESPN side, so each distinct name is folded once.
+@lru_cache(maxsize=None)
 def normalize(s):
     n = strip_accents(s)
-    for suf in _SUFFIXES:
-        if n.endswith(suf):
-            n = n[: -len(suf)].strip()
-            break
+    head, sep, tail = n.rpartition(" ")
+    if sep and tail in _SUFFIXES:
+        n = head.strip()
     return n
 
 
@@ -183,6 +193,56 @@ def http_json(url):
     return None
 
 
+def _load_search_cache():
+    """SEARCH_CACHE_PATH as {name: {"fetched": iso date, "data": response}}; unreadable -> empty."""
+    if not os.path.exists(SEARCH_CACHE_PATH):
+        return {}
+    try:
+        with open(SEARCH_CACHE_PATH, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError) as e:
+        log(f"  [!] ignoring unreadable people/search cache: {e}")
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    # entries from the old format (bare response, no fetch date) count as stale
+    return {n: e for n, e in cache.items() if isinstance(e, dict) and "fetched" in e and "data" in e}
+
+
+def search_people(names, workers=8):
+    """people/search for many names at once -> {name: response json or None}.
+
+    Unique names are fetched concurrently in one bulk pass up front, so the
+    bridge loops below do dict lookups instead of one serial request per row.
+    Hits are kept in SEARCH_CACHE_PATH with their fetch date and reused for
+    SEARCH_CACHE_TTL_DAYS; older entries, new names and names that found nobody
+    are re-queried. A stale hit is still used if its re-query fails.
+    """
+    cache = _load_search_cache()
+    cutoff = (date.today() - timedelta(days=SEARCH_CACHE_TTL_DAYS)).isoformat()
+    uniq = list(dict.fromkeys(n for n in names if n))
+    todo = [n for n in uniq if n not in cache or cache[n]["fetched"] < cutoff]
+
+    def fetch(name):
+        url = "https://statsapi.mlb.com/api/v1/people/search?names=" + urllib.parse.quote(name)
+        return name, http_json(url)
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        fetched = dict(ex.map(fetch, todo))
+    log(f"  people/search: {len(uniq) - len(todo)} cached, {len(todo)} fetched")
+
+    today = date.today().isoformat()
+    new_hits = {n: {"fetched": today, "data": d} for n, d in fetched.items() if (d or {}).get("people")}
+    if new_hits:
+        cache.update(new_hits)
+        os.makedirs(os.path.dirname(SEARCH_CACHE_PATH), exist_ok=True)
+        tmp = SEARCH_CACHE_PATH + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, SEARCH_CACHE_PATH)
+    return {n: cache[n]["data"] if n in cache else fetched.get(n) for n in uniq}
+
+
 def year_from_filename(fname):
     base = os.path.basename(fname)
     if len(base) >= 4 and base[:4].isdigit():
@@ -556,13 +616,13 @@ def bridge(universe, lineup_only, espn_by_norm, espn_by_statcast, espn_by_id, of
         unmatched = [r for eid, r in espn_by_id.items()
                      if eid not in matched_espn and surname_candidate(r["espn_name"])]
         log(f"  API bridge candidates (surname pre-filter): {len(unmatched)}")
+        searched = search_people([r["espn_name"] for r in unmatched] + list(lineup_only.values()))
         resolved = 0
         for r in unmatched:
             name = r["espn_name"]
             if not name:
                 continue
-            url = "https://statsapi.mlb.com/api/v1/people/search?names=" + urllib.parse.quote(name)
-            data = http_json(url)
+            data = searched.get(name)
             for person in (data or {}).get("people", []):
                 mlbam = str(person.get("id", "")).strip()
                 urec = universe.get(mlbam)
@@ -587,8 +647,7 @@ def bridge(universe, lineup_only, espn_by_norm, espn_by_statcast, espn_by_id, of
     if not offline:
         added = 0
         for n, raw in lineup_only.items():
-            url = "https://statsapi.mlb.com/api/v1/people/search?names=" + urllib.parse.quote(raw)
-            data = http_json(url)
+            data = searched.get(raw)
             for person in (data or {}).get("people", []):
                 mlbam = str(person.get("id", "")).strip()
                 if mlbam and mlbam not in universe:
@@ -7,14 +7,13 @@ Description: Evaluates weekly roster checkpoints for a target team by comparing
 Source Data: {YEAR}_mlb_stats_boxscore.csv, {YEAR}_espn_roster_history.csv, player_map.csv
 Outputs:     fantasy_baseball/reports/roster_analysis_report_{YEAR}.md
 
-Notes: csv + numpy only (no pandas). Rows loaded as list[dict].
+Notes: csv + numpy only (no pandas). Stats streamed via csv.reader; small files loaded as list[dict].
 """
 
 import csv
 import os
 import sys
-from collections import defaultdict
-from datetime import datetime, timedelta
+from datetime import timedelta
 
 import numpy as np
 
@@ -41,30 +40,6 @@ BATTER_STATS = ['R', 'HR', 'RBI', 'SB']
 PITCHER_POSITIVE = ['QS', 'SVHD', 'K']
 
 
-def read_csv(path):
-    with open(path, encoding='utf-8-sig', errors='replace') as f:
-        return list(csv.DictReader(f))
-
-
-def parse_date(s):
-    s = (s or '').strip()
-    if not s:
-        return None
-    for fmt in ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y'):
-        try:
-            return datetime.strptime(s[:19], fmt).date()
-        except ValueError:
-            continue
-    return None
-
-
-def to_float(v):
-    try:
-        return float(v)
-    except (TypeError, ValueError):
-        return 0.0
-
-
 def main():
     print(f"Running Analysis for {SEASON}")
     print(f"Data Path: {BASE_PATH}")
@@ -76,9 +51,8 @@ def main():
         sys.exit(0)
 
     print("Loading data...")
-    roster_rows = read_csv(ROSTER_PATH)
-    stats_rows = read_csv(STATS_PATH)
-    map_rows = read_csv(MAP_PATH)
+    roster_rows = mp.read_csv(ROSTER_PATH)
+    map_rows = mp.read_csv(MAP_PATH)
 
     # mlbam game-log id -> (espn_id, name) bridge from the canonical file
     mlbam_to_espn = {}
@@ -88,85 +62,82 @@ def main():
         if mlbam and espn:
             mlbam_to_espn[mlbam] = (espn, (r.get('espn_name') or r.get('mlb_name') or '').strip())
 
-    # ── Parse stats; attach espn id; group rows by date ──────────────────────────
-    rows_by_date = defaultdict(list)
+    # ── Stream stats; attach espn id; keep only (date, id, name, stat vector) ────
+    # The stats file is the big one: read it row-by-row with column positions
+    # resolved once, instead of materializing a dict per row up front.
+    kept = []  # (date, espn_id, name, stat vector)
     max_date = None
-    for r in stats_rows:
-        d = parse_date(r.get('date'))
-        if d is None:
-            continue
-        mlbam = (r.get('player_id') or '').strip()
-        bridge = mlbam_to_espn.get(mlbam)
-        if not bridge:
-            continue  # no espn mapping -> excluded (same as old how='left' + dropna on key)
-        espn_id, name = bridge
-        r['_date'] = d
-        r['_espn_id'] = espn_id
-        r['_name'] = name or (r.get('player_name') or '')
-        rows_by_date[d].append(r)
-        if max_date is None or d > max_date:
-            max_date = d
+    with open(STATS_PATH, encoding='utf-8-sig', errors='replace') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        col = {c: i for i, c in enumerate(header)}
+        pos_cols = [c for c in BATTER_STATS + PITCHER_POSITIVE if c in col]
+        has_whip = 'P_H' in col and 'P_BB' in col
+        has_er = 'ER' in col
+        stat_idx = [[col[c]] for c in pos_cols]
+        if has_whip:
+            stat_idx.append([col['P_H'], col['P_BB']])
+        if has_er:
+            stat_idx.append([col['ER']])
+        i_pid, i_date, i_name = col.get('player_id'), col.get('date'), col.get('player_name')
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row += [''] * (width - len(row))
+            d = mp.parse_date(row[i_date] if i_date is not None else None)
+            if d is None:
+                continue
+            bridge = mlbam_to_espn.get(row[i_pid].strip() if i_pid is not None else '')
+            if not bridge:
+                continue  # no espn mapping -> excluded (same as old how='left' + dropna on key)
+            espn_id, name = bridge
+            vec = [sum(mp.to_float(row[i]) for i in idx) for idx in stat_idx]
+            kept.append((d, espn_id, name or (row[i_name] if i_name is not None else ''), vec))
+            if max_date is None or d > max_date:
+                max_date = d
+    kept.sort(key=lambda t: t[0])
 
     # ── Per-date z-score Daily_Value, aggregated to (date, espn_id) ───────────────
     print("Computing per-day z-score values...")
-    # daily_value[(date, espn_id)] = summed value; name_of[espn_id] = name
-    daily_value = defaultdict(float)
-    name_of = {}
-    for d, rows in rows_by_date.items():
-        def zscores(values):
-            arr = np.array(values, dtype=float)
-            mean = arr.mean()
-            std = arr.std(ddof=1) if len(arr) > 1 else 0.0
-            std = std if std else 1.0
-            return (arr - mean) / std
-
-        n = len(rows)
-        contrib = np.zeros(n)
-        for col in BATTER_STATS + PITCHER_POSITIVE:
-            if rows and col in rows[0]:
-                contrib += zscores([to_float(r.get(col)) for r in rows])
-        if rows and 'P_H' in rows[0] and 'P_BB' in rows[0]:
-            contrib -= zscores([to_float(r.get('P_H')) + to_float(r.get('P_BB')) for r in rows])
-        if rows and 'ER' in rows[0]:
-            contrib -= zscores([to_float(r.get('ER')) for r in rows])
-
-        for r, c in zip(rows, contrib):
-            daily_value[(d, r['_espn_id'])] += float(c)
-            name_of[r['_espn_id']] = r['_name']
+    # One grouped pass over all dates: rows are date-sorted, so each date is a
+    # contiguous block; negative categories (WHIP proxy, ER) carry a -1 sign.
+    signs = np.array([1.0] * len(pos_cols) + [-1.0] * (has_whip + has_er))
+    X = np.array([t[3] for t in kept], dtype=float).reshape(len(kept), len(signs))
+    day_arr = np.array([t[0] for t in kept], dtype='datetime64[D]')
+    starts = np.flatnonzero(np.r_[True, day_arr[1:] != day_arr[:-1]]) if len(kept) else np.zeros(0, int)
+    contrib = mp.grouped_zscores(X, starts) @ signs
+
+    name_of = {espn_id: name for _, espn_id, name, _ in kept}
 
     # ── 28-day rolling mean over the sorted distinct dates ───────────────────────
     print(f"Calculating {WINDOW}-day rolling value...")
-    dates = sorted({d for (d, _) in daily_value})
-    players = sorted({p for (_, p) in daily_value})
+    # Integer codes for (date, player): dates from the sorted row blocks, players from
+    # np.unique, so the matrix is filled by one scatter-add instead of tuple-keyed dicts.
+    dates = day_arr[starts].tolist()
     date_idx = {d: i for i, d in enumerate(dates)}
+    date_code = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, len(kept))))
+    players, player_code = np.unique(np.array([t[1] for t in kept], dtype=str), return_inverse=True)
+    players = players.tolist()
+    pcol = {p: j for j, p in enumerate(players)}
     # matrix [date, player] of daily value (0-filled like the old pivot.fillna(0))
     mat = np.zeros((len(dates), len(players)))
-    pcol = {p: j for j, p in enumerate(players)}
-    for (d, p), v in daily_value.items():
-        mat[date_idx[d], pcol[p]] = v
+    np.add.at(mat, (date_code, player_code), contrib)
 
-    # rolling mean: row i uses rows [i-WINDOW+1, i]; NaN until WINDOW rows available
+    # rolling mean: row i uses rows [i-WINDOW+1, i]; NaN until WINDOW rows available.
+    # Running sums with a zero row prepended give every window as one slice difference.
     rolling = np.full(mat.shape, np.nan)
-    csum = np.cumsum(mat, axis=0)
-    for i in range(len(dates)):
-        if i >= WINDOW - 1:
-            window_sum = csum[i] - (csum[i - WINDOW] if i - WINDOW >= 0 else 0)
-            rolling[i] = window_sum / WINDOW
-
-    def rolling_value(d, espn_id):
-        i = date_idx.get(d)
-        j = pcol.get(espn_id)
-        if i is None or j is None:
-            return None
-        v = rolling[i, j]
-        return None if np.isnan(v) else float(v)
+    csum = np.vstack([np.zeros((1, mat.shape[1])), np.cumsum(mat, axis=0)])
+    if len(dates) >= WINDOW:
+        rolling[WINDOW - 1:] = (csum[WINDOW:] - csum[:-WINDOW]) / WINDOW
 
     # ── Parse roster history ─────────────────────────────────────────────────────
     rosters = []
     season_start = None
     for r in roster_rows:
-        sd = parse_date(r.get('start_date'))
-        ed = parse_date(r.get('end_date')) or max_date
+        sd = mp.parse_date(r.get('start_date'))
+        ed = mp.parse_date(r.get('end_date')) or max_date
         if sd is None:
             continue
         rosters.append({
@@ -182,37 +153,60 @@ def main():
     print("Analyzing Roster moves (Weekly Checkpoints)...")
     mondays = []
     if season_start and max_date:
-        d = season_start + timedelta(days=(7 - season_start.weekday()) % 7)  # first Monday >= start
-        while d <= max_date:
-            mondays.append(d)
-            d += timedelta(days=7)
+        first = season_start + timedelta(days=(7 - season_start.weekday()) % 7)  # first Monday >= start
+        mondays = np.arange(np.datetime64(first), np.datetime64(max_date) + 1, 7, dtype='datetime64[D]').tolist()
+
+    # Each stint spans a contiguous run of checkpoints, found by binary search on the
+    # sorted Mondays. From that, one pass builds (a) a [monday, player] "rostered by
+    # anyone" mask via a +1/-1 difference array and (b) our own stints per Monday.
+    rostered = np.zeros((len(mondays), len(players)), dtype=bool)
+    pjr_by_monday = [[] for _ in mondays]
+    if mondays and rosters:
+        mon_arr = np.array(mondays, dtype='datetime64[D]')
+        lo = np.searchsorted(mon_arr, np.array([r['start_date'] for r in rosters], dtype='datetime64[D]'), 'left')
+        hi = np.searchsorted(mon_arr, np.array([r['end_date'] for r in rosters], dtype='datetime64[D]'), 'right')
+        cols = np.array([pcol.get(r['player_id'], -1) for r in rosters], dtype=int)
+        known = (cols >= 0) & (hi > lo)  # stint maps to a player and covers a Monday
+        delta = np.zeros((len(mondays) + 1, len(players)), dtype=np.int32)
+        np.add.at(delta, (lo[known], cols[known]), 1)
+        np.add.at(delta, (hi[known], cols[known]), -1)
+        rostered = np.cumsum(delta, axis=0)[:-1] > 0
+        for r, a, b in zip(rosters, lo.tolist(), hi.tolist()):
+            if r['team_abbrev'] == TEAM_ABBREV:
+                for k in range(a, b):
+                    pjr_by_monday[k].append(r)
 
     recommendations = []
-    for check_date in mondays:
-        active = [r for r in rosters if r['start_date'] <= check_date <= r['end_date']]
-        pjr = [r for r in active if r['team_abbrev'] == TEAM_ABBREV]
+    for k, (check_date, pjr) in enumerate(zip(mondays, pjr_by_monday)):
         if not pjr:
             continue
-        rostered_ids = {r['player_id'] for r in active}
+        i = date_idx.get(check_date)
+        if i is None:
+            continue  # no rolling values this date -> no FA pool to compare against
+        row = rolling[i]  # rolling value of every player on this Monday
 
         # FA pool: players with a rolling value this date, not rostered by anyone
-        fa = []
-        for p in players:
-            if p in rostered_ids:
-                continue
-            rv = rolling_value(check_date, p)
-            if rv is not None:
-                fa.append((p, rv))
-        fa.sort(key=lambda x: x[1], reverse=True)
-        top_fas = fa[:20]
-
-        for r in pjr:
-            my_val = rolling_value(check_date, r['player_id'])
-            if my_val is None:
-                my_val = -999.0
-            better = [(p, v) for (p, v) in top_fas if v > my_val + VALUE_DELTA]
-            if better:
-                opts = [f"{name_of.get(p, p)} ({v:.2f})" for p, v in better[:2]]
+        avail = ~np.isnan(row) & ~rostered[k]
+        fa_cols = np.flatnonzero(avail)
+        if len(fa_cols) > 20:
+            # Partial selection: keep only values >= the 20th largest (ties included),
+            # so the stable sort below runs on ~20 players instead of the whole pool.
+            vals = row[fa_cols]
+            kth = np.partition(vals, len(vals) - 20)[len(vals) - 20]
+            fa_cols = fa_cols[vals >= kth]
+        top_cols = fa_cols[np.argsort(-row[fa_cols], kind='stable')][:20]
+        top_vals = row[top_cols]
+
+        # All of our players vs the top FAs in one broadcast compare. top_vals is
+        # sorted descending, so the FAs clearing a player's bar are a prefix of it.
+        my_cols = np.array([pcol.get(r['player_id'], -1) for r in pjr], dtype=int)
+        my_vals = np.where(my_cols >= 0, row[my_cols], np.nan)
+        my_vals = np.where(np.isnan(my_vals), -999.0, my_vals)
+        n_better = (top_vals[None, :] > (my_vals[:, None] + VALUE_DELTA)).sum(axis=1)
+
+        for r, my_val, n in zip(pjr, my_vals.tolist(), n_better.tolist()):
+            if n:
+                opts = [f"{name_of.get(players[j], players[j])} ({row[j]:.2f})" for j in top_cols[:min(n, 2)]]
                 recommendations.append({
                     'Date': check_date.strftime('%Y-%m-%d'),
                     'My_Player': r['player_name'],
@@ -74,24 +74,24 @@ def main():
             pbsp = (m.get(side) or {}).get('pointsByScoringPeriod') or {}
             mp_to_sps[mp_id].update(int(k) for k in pbsp.keys())
 
+    # One pass: dates increase with scoring period, so a matchup's start/end are the
+    # dates of its first and last sorted scoring periods.
     rows = []
     for mp_id in sorted(mp_to_sps):
-        for sp in sorted(mp_to_sps[mp_id]):
-            game_date = opening_day + timedelta(days=sp - 1)
+        sps = sorted(mp_to_sps[mp_id])
+        if not sps:
+            continue  # matchup has not started yet (no points data)
+        start = (opening_day + timedelta(days=sps[0] - 1)).isoformat()
+        end = (opening_day + timedelta(days=sps[-1] - 1)).isoformat()
+        for sp in sps:
             rows.append({
                 'matchup_period': mp_id,
                 'scoring_period': sp,
-                'date': game_date.isoformat(),
+                'date': (opening_day + timedelta(days=sp - 1)).isoformat(),
+                'matchup_start_date': start,
+                'matchup_end_date': end,
             })
 
-    by_mp = defaultdict(list)
-    for r in rows:
-        by_mp[r['matchup_period']].append(r['date'])
-    for r in rows:
-        dates = by_mp[r['matchup_period']]
-        r['matchup_start_date'] = min(dates)
-        r['matchup_end_date'] = max(dates)
-
     os.makedirs(mp.DATA_PATH, exist_ok=True)
     save_path = os.path.join(mp.DATA_PATH, f"{year}_espn_schedule_matchup.csv")
     fieldnames = ['matchup_period', 'scoring_period', 'date', 'matchup_start_date', 'matchup_end_date']
@@ -2,23 +2,41 @@ import os
 import csv
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import configparser
 import numpy as np
 import pandas as pd
 import time
 import io
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 import seaborn as sb
 from datetime import datetime, date, timedelta
 from bs4 import BeautifulSoup
+import soupsieve as sv
 from espn_api.baseball import League
 from espn_api.baseball.constant import POSITION_MAP, PRO_TEAM_MAP, STATS_MAP
-from statsmodels import regression
-import statsmodels.api as sm
+from scipy import stats as scipy_stats
 import urllib.request
 import urllib.error
 import re
 import unicodedata
 
+try:
+    import orjson  # optional: faster decoding of the large ESPN/MLB JSON payloads
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    import lxml  # noqa: F401  optional: C-backed html parser for the BeautifulSoup scrapers
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 MONTH_DCT = {
     'Feb': '02', 'Mar': '03', 'Apr': '04', 'May': '05',
     'Jun': '06', 'Jul': '07', 'Aug': '08', 'Sep': '09',
@@ -32,6 +50,17 @@ ESPN_HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36',
 }
 
+# Shared keep-alive session for the ESPN / MLB / Rotowire fetchers. Callers still
+# pass their own headers per request; the session only pools and retries connections.
+# Throttled / 5xx responses are retried with backoff (honouring Retry-After); once
+# retries run out the last response is returned so callers' status checks still apply.
+# requests already advertises brotli in Accept-Encoding when the brotli package is installed.
+HTTP_POOL_SIZE = 32
+HTTP_RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False)
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE,
+                                       max_retries=HTTP_RETRY))
+
 TEAM_SLUG_MAP = {
     'Bal': 'orioles',
     'Bos': 'redsox',
@@ -132,33 +161,79 @@ def setup_league(config, year=2025):
     
     return League(league_id=league_id, year=year, espn_s2=espn_s2, swid=swid)
 
+def _json_leaf_items(obj):
+    """
+    Yields (key, value) for every non-container entry of nested JSON, depth-first.
+    Nested dicts, and lists whose first element is a container, are descended into
+    where they appear rather than yielded. Uses an explicit stack, so callers can
+    stop early.
+    """
+    stack = []
+
+    def push(o):
+        if isinstance(o, dict):
+            stack.append((True, iter(o.items())))
+        elif isinstance(o, list):
+            stack.append((False, iter(o)))
+
+    push(obj)
+    done = object()
+    while stack:
+        is_dict, it = stack[-1]
+        item = next(it, done)
+        if item is done:
+            stack.pop()
+        elif not is_dict:
+            push(item)
+        else:
+            k, v = item
+            if isinstance(v, dict) or (isinstance(v, list) and v and isinstance(v[0], (list, dict))):
+                push(v)
+            else:
+                yield k, v
+
 def json_parsing(obj, key):
     """
-    Recursively pull values of specified key from nested JSON.
+    Pull the first value of specified key from nested JSON.
+    Walks depth-first (nested containers are entered where they appear) and stops
+    at the first match.
     
     Args:
         obj (dict/list): Input JSON data.
         key (str): Key to search for.
         
     Returns:
-        list or value: All matching values found.
+        value or list: First matching value found, or [] if none.
     """
-    arr = []
+    for k, v in _json_leaf_items(obj):
+        if k == key:
+            return v
+    return []
 
-    def extract(obj, arr, key):
-        if isinstance(obj, dict):
-            for k, v in obj.items():
-                if isinstance(v, (dict)) or (isinstance(v, (list)) and  v and isinstance(v[0], (list, dict))):
-                    extract(v, arr, key)
-                elif k == key:
-                    arr.append(v)
-        elif isinstance(obj, list):
-            for item in obj:
-                extract(item, arr, key)
-        return arr
+def json_extract_fields(obj, keys) -> dict:
+    """
+    Pull the first value of several keys from nested JSON in a single traversal.
+    Equivalent to {k: json_parsing(obj, k) for k in keys}, but walks the tree once
+    and stops as soon as every key has been found.
 
-    results = extract(obj, arr, key)
-    return results[0] if results else results
+    Args:
+        obj (dict/list): Input JSON data.
+        keys (iterable): Keys to search for.
+
+    Returns:
+        dict: key -> first matching value ([] if not found).
+    """
+    remaining = set(keys)
+    out = {}
+    for k, v in _json_leaf_items(obj):
+        if k in remaining:
+            out[k] = v
+            remaining.discard(k)
+            if not remaining:
+                break
+    for k in remaining:
+        out[k] = []
+    return out
 
 def remove_none(lst: list) -> list:
     """Removes None values from a list."""
@@ -171,6 +246,7 @@ SEASON_OPENING_DAYS = {
     2026: date(2026, 3, 26),
 }
 
+@lru_cache(maxsize=None)
 def date_to_scoring_period(target_date, season_year):
     """
     Convert a calendar date to an ESPN scoring period ID.
@@ -191,8 +267,53 @@ def date_to_scoring_period(target_date, season_year):
         raise ValueError(f"Date {target_date} is before the {season_year} season opening ({opening}).")
     return delta
 
+@lru_cache(maxsize=4096)
+def parse_date(s):
+    """
+    Parse a data-lake date cell into a date, tolerating the formats the CSVs use.
+
+    Args:
+        s (str): 'YYYY-MM-DD', 'YYYY-MM-DD HH:MM:SS' or 'MM/DD/YYYY'; blank/None allowed.
+
+    Returns:
+        datetime.date | None: The parsed date, or None if empty/unparseable.
+
+    Memoized: data-lake files repeat the same few hundred date strings across rows.
+    """
+    s = (s or '').strip()
+    if not s:
+        return None
+    if len(s) == 10 and s[4] == '-' and s[7] == '-':
+        # Fast path for the common zero-padded ISO date; strptime is the fallback
+        try:
+            return date.fromisoformat(s)
+        except ValueError:
+            pass
+    for fmt in ('%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y'):
+        try:
+            return datetime.strptime(s[:19], fmt).date()
+        except ValueError:
+            continue
+    return None
+
 # --- Data Fetching Functions ---
 
+# ESPN gamelog stat columns (positional) and how each is typed
+PITCHER_LOG_COLUMNS = ('IP', 'H', 'R', 'ER', 'HR', 'BB', 'K', 'GB', 'FB', 'P', 'TBF', 'GSC', 'DEC', 'REL', 'ERA')
+PITCHER_LOG_FLOATS = frozenset({'IP', 'GSC', 'ERA'})
+PITCHER_LOG_INTS = frozenset({'H', 'R', 'ER', 'HR', 'BB', 'K', 'GB', 'FB', 'P', 'TBF'})
+BATTER_LOG_COLUMNS = ('AB', 'R', 'H', '2B', '3B', 'HR', 'RBI', 'BB', 'HBP', 'SO', 'SB', 'CS', 'AVG', 'OBP', 'SLG', 'OPS')
+BATTER_LOG_FLOATS = frozenset({'AVG', 'OBP', 'SLG', 'OPS'})  # everything else is an int
+GAME_LOG_EVENT_FIELDS = ('id', 'week', 'gameDate', 'score', 'homeTeamId', 'awayTeamId',
+                         'homeTeamScore', 'awayTeamScore', 'gameResult')
+GAME_LOG_EVENT_COLUMNS = GAME_LOG_EVENT_FIELDS + ('opponentId', 'opponentAbbreviation', 'teamId', 'teamAbbreviation')
+
+def _game_log_event_info(events: dict) -> dict:
+    """Flattens a gamelog response's events into eventId -> tuple ordered as GAME_LOG_EVENT_COLUMNS."""
+    return {k: tuple(v[f] for f in GAME_LOG_EVENT_FIELDS) + (v['opponent']['id'], v['opponent']['abbreviation'],
+                                                            v['team']['id'], v['team']['abbreviation'])
+            for k, v in events.items()}
+
 def get_pitcher_game_logs(player_id: int, year: int = 2025) -> list:
     """
     Fetches game logs for a pitcher from ESPN API.
@@ -205,7 +326,7 @@ def get_pitcher_game_logs(player_id: int, year: int = 2025) -> list:
         list: List of game log dictionaries.
     """
     url = f"https://site.web.api.espn.com/apis/common/v3/sports/baseball/mlb/athletes/{player_id}/gamelog?region=us&lang=en&contentorigin=espn&season={year}&category=pitching"
-    response = requests.get(url, headers=ESPN_HEADERS).json()
+    response = _json_loads(_SESSION.get(url, headers=ESPN_HEADERS).content)
 
     games = []
     if 'seasonTypes' in response:
@@ -213,42 +334,37 @@ def get_pitcher_game_logs(player_id: int, year: int = 2025) -> list:
 
     game_log = []
     if games:
-        game_info = {}
-        for k, v in response['events'].items():
-            d = {i: v[i] for i in ('id', 'week', 'gameDate', 'score', 'homeTeamId', 'awayTeamId', 'homeTeamScore', 'awayTeamScore', 'gameResult')}
-            d['opponentId'] = v['opponent']['id']
-            d['opponentAbbreviation'] = v['opponent']['abbreviation']
-            d['teamId'] = v['team']['id']
-            d['teamAbbreviation'] = v['team']['abbreviation']
-            game_info[k] = d
+        game_info = _game_log_event_info(response['events'])
         
         for i in games:
             for j in i['events']:
-                stats_list = ['IP', 'H', 'R', 'ER', 'HR', 'BB', 'K', 'GB', 'FB', 'P', 'TBF', 'GSC', 'DEC', 'REL', 'ERA']
                 # Check if j['stats'] exists or has enough elements to zip safely
                 if 'stats' not in j:
                     continue
-                    
-                d = dict(zip(stats_list, j['stats']))
 
-                for k, v in d.items():
-                    if k in ('IP', 'GSC', 'ERA'):
-                        d[k] = float(v)
-                    elif k in ('H', 'R', 'ER', 'HR', 'BB', 'K', 'GB', 'FB', 'P', 'TBF'):
-                        d[k] = int(v)
-                
-                if d.get('IP', 0.0) == 0.0:
-                    d['IP'] = 1.0 # Avoid division by zero
-                    
-                d['WHIP'] = round((d['BB'] + d['H']) / d['IP'], 2)
-                d['K/9'] = round((d['K'] / d['IP']) * 9, 2)
-                
-                # The original code had a nested append which was likely a bug or redundant: game_log.append(game_log.append(...))
-                # Fixed to single append
                 entry = {'playerId': player_id, 'year': year}
-                entry.update(game_info.get(j['eventId'], {}))
-                entry.update(d)
+                info = game_info.get(j['eventId'])
+                if info:
+                    entry.update(zip(GAME_LOG_EVENT_COLUMNS, info))
+                for k, v in zip(PITCHER_LOG_COLUMNS, j['stats']):
+                    entry[k] = float(v) if k in PITCHER_LOG_FLOATS else int(v) if k in PITCHER_LOG_INTS else v
+
+                if entry.get('IP', 0.0) == 0.0:
+                    entry['IP'] = 1.0 # Avoid division by zero
+
                 game_log.append(entry)
+
+    if game_log:
+        # Derived rate stats for every game at once
+        ip = np.array([g['IP'] for g in game_log], dtype=float)
+        h = np.array([g['H'] for g in game_log], dtype=float)
+        bb = np.array([g['BB'] for g in game_log], dtype=float)
+        k = np.array([g['K'] for g in game_log], dtype=float)
+        whip = np.round((bb + h) / ip, 2).tolist()
+        k9 = np.round(k / ip * 9, 2).tolist()
+        for g, w, k9_val in zip(game_log, whip, k9):
+            g['WHIP'] = w
+            g['K/9'] = k9_val
     return game_log
 
 def get_batter_game_logs(player_id: int, year: int = 2025) -> list:
@@ -263,7 +379,7 @@ def get_batter_game_logs(player_id: int, year: int = 2025) -> list:
         list: List of game log dictionaries.
     """
     url = f"https://site.web.api.espn.com/apis/common/v3/sports/baseball/mlb/athletes/{player_id}/gamelog?region=us&lang=en&contentorigin=espn&season={year}&category=batting"
-    response = requests.get(url, headers=ESPN_HEADERS).json()
+    response = _json_loads(_SESSION.get(url, headers=ESPN_HEADERS).content)
 
     games = []
     if 'seasonTypes' in response:
@@ -271,34 +387,48 @@ def get_batter_game_logs(player_id: int, year: int = 2025) -> list:
 
     game_log = []
     if games:
-        game_info = {}
-        for k, v in response['events'].items():
-            d = {i: v[i] for i in ('id', 'week', 'gameDate', 'score', 'homeTeamId', 'awayTeamId', 'homeTeamScore', 'awayTeamScore', 'gameResult')}
-            d['opponentId'] = v['opponent']['id']
-            d['opponentAbbreviation'] = v['opponent']['abbreviation']
-            d['teamId'] = v['team']['id']
-            d['teamAbbreviation'] = v['team']['abbreviation']
-            game_info[k] = d
+        game_info = _game_log_event_info(response['events'])
         
         for i in games:
             for j in i['events']:
-                stats_list = ['AB', 'R', 'H', '2B', '3B', 'HR', 'RBI', 'BB', 'HBP', 'SO', 'SB', 'CS', 'AVG', 'OBP', 'SLG', 'OPS']
                 if 'stats' not in j:
                     continue
-                d = dict(zip(stats_list, j['stats']))
-
-                for k, v in d.items():
-                    if k in ('AVG', 'OBP', 'SLG', 'OPS'):
-                        d[k] = float(v)
-                    else:
-                        d[k] = int(v)
-
                 entry = {'playerId': player_id, 'year': year}
-                entry.update(game_info.get(j['eventId'], {}))
-                entry.update(d)
+                info = game_info.get(j['eventId'])
+                if info:
+                    entry.update(zip(GAME_LOG_EVENT_COLUMNS, info))
+                for k, v in zip(BATTER_LOG_COLUMNS, j['stats']):
+                    entry[k] = float(v) if k in BATTER_LOG_FLOATS else int(v)
+
                 game_log.append(entry)
     return game_log
 
+ESPN_GAME_LOG_WORKERS = 16
+
+def get_game_logs_batch(player_ids, year: int = 2025, category: str = 'batting',
+                        max_workers: int = ESPN_GAME_LOG_WORKERS) -> dict:
+    """
+    Fetches ESPN game logs for many players concurrently over the shared pooled session.
+
+    Args:
+        player_ids (iterable): ESPN Player IDs.
+        year (int): Season year.
+        category (str): 'batting' or 'pitching'.
+        max_workers (int): Concurrent requests.
+
+    Returns:
+        dict: player_id -> list of game log dictionaries (input order preserved).
+    """
+    fetch = get_pitcher_game_logs if category == 'pitching' else get_batter_game_logs
+    player_ids = list(player_ids)
+    with ThreadPoolExecutor(max_workers=min(max_workers, HTTP_POOL_SIZE)) as ex:
+        logs = list(ex.map(lambda pid: fetch(pid, year), player_ids))
+    return dict(zip(player_ids, logs))
+
+
+_LINEUP_BOX_SEL = sv.compile('.lineup__box')
+
+
 def get_daily_lineups():
     """
     Scrapes daily MLB lineups from Rotowire.
@@ -307,136 +437,254 @@ def get_daily_lineups():
         tuple: (list of pitcher data, list of batter data)
     """
     url = "https://www.rotowire.com/baseball/daily-lineups.php"
-    response = requests.get(url)
-    soup = BeautifulSoup(response.content, "html.parser")
+    response = _SESSION.get(url)
+    soup = BeautifulSoup(response.content, HTML_PARSER)
+    # The page carries a single game date; read it once instead of walking back per player.
+    main = soup.select_one('main[data-gamedate]')
+    gamedate = main.get('data-gamedate') if main else None
 
     data_pitching = []
     data_batter = []
     team_type = ''
-    order_count = 1
-
-    for e in soup.select('.lineup__box ul li'):
-        # Check if we moved to a new team section
-        if e.parent.get('class'):
-            current_team_type = e.parent.get('class')[-1]
-            if team_type != current_team_type:
-                order_count = 1
-                team_type = current_team_type
-
-        if e.get('class') and 'lineup__player-highlight' in e.get('class'):
-            data_pitching.append({
-                'date': e.find_previous('main').get('data-gamedate'),
-                'game_time': e.find_previous('div', attrs={'class':'lineup__time'}).get_text(strip=True),
-                'pitcher_name': e.a.get_text(strip=True),
-                'team': e.find_previous('div', attrs={'class':team_type}).next.strip(),
-                'lineup_throws': e.span.get_text(strip=True)
-            })
-        elif e.get('class') and 'lineup__player' in e.get('class'):
-            data_batter.append({
-                'date': e.find_previous('main').get('data-gamedate'),
-                'game_time': e.find_previous('div', attrs={'class':'lineup__time'}).get_text(strip=True),
-                'pitcher_name': e.a.get_text(strip=True),
-                'team': e.find_previous('div', attrs={'class':team_type}).next.strip(),
-                'pos': e.div.get_text(strip=True),
-                'batting_order': order_count,
-                'lineup_bats': e.span.get_text(strip=True)
-            })
-            order_count += 1
-            
+
+    # Game time and team name are per box / per list, so resolve them once there
+    # rather than walking back through the DOM for every player.
+    for box in _LINEUP_BOX_SEL.select(soup):
+        time_div = box.find('div', attrs={'class': 'lineup__time'})
+        game_time = time_div.get_text(strip=True) if time_div else None
+
+        for ul in box.find_all('ul'):
+            if ul.get('class'):
+                team_type = ul.get('class')[-1]
+            team_div = ul.find_previous('div', attrs={'class': team_type})
+            team = team_div.next.strip() if team_div else None
+            order_count = 1
+
+            for e in ul.find_all('li', recursive=False):
+                classes = e.get('class') or ()
+                if 'lineup__player-highlight' in classes:
+                    data_pitching.append({
+                        'date': gamedate,
+                        'game_time': game_time,
+                        'pitcher_name': e.a.get_text(strip=True),
+                        'team': team,
+                        'lineup_throws': e.span.get_text(strip=True)
+                    })
+                elif 'lineup__player' in classes:
+                    data_batter.append({
+                        'date': gamedate,
+                        'game_time': game_time,
+                        'pitcher_name': e.a.get_text(strip=True),
+                        'team': team,
+                        'pos': e.div.get_text(strip=True),
+                        'batting_order': order_count,
+                        'lineup_bats': e.span.get_text(strip=True)
+                    })
+                    order_count += 1
+
     return data_pitching, data_batter
 
+MLB_SCHED_HEADERS = {'Connection': 'keep-alive', 'Accept': 'application/json', 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36'}
+MLB_SCHED_WORKERS = 8
+MLB_SCHED_CACHE_DIR = os.path.join(DATA_PATH, 'cache', 'mlb_sched')
+MLB_SCHED_REFRESH_DAYS = 2  # days this recent are always re-fetched (postponements, late changes)
+
+# Schedule page elements by role: component class -> (role, classes the div must carry).
+# Note: Class names are hashed and likely brittle.
+_SCHED_CLASS_ROLES = {
+    'ScheduleCollectionGridstyle__DateLabel-sc-c0iua4-5': (
+        ('weekday', frozenset({'iaVuoa'})),
+        ('date', frozenset({'fQIzmH'})),
+    ),
+    'ScheduleCollectionGridstyle__GameTypeLabel-sc-c0iua4-6': (('game_type', frozenset({'dTLQcW'})),),
+    'ScheduleCollectionGridstyle__SectionWrapper-sc-c0iua4-0': (('section', frozenset({'guIOQi'})),),
+}
+_SCHED_MATCHUP_SEL = sv.compile('div.TeamMatchupLayerstyle__TeamMatchupLayerWrapper-sc-ouprud-0.gQznxP.teammatchup-teaminfo')
+
+
+def _sched_class_index(soup) -> dict:
+    """Buckets the schedule page's divs by role in a single pass over the tree (document order kept)."""
+    index = {'weekday': [], 'date': [], 'game_type': [], 'section': []}
+    for el in soup.find_all('div', class_=True):
+        classes = el.get('class')
+        for c in classes:
+            roles = _SCHED_CLASS_ROLES.get(c)
+            if roles:
+                for role, required in roles:
+                    if required.issubset(classes):
+                        index[role].append(el)
+                break
+    return index
+
+
+def _sched_abbrev(raw: str) -> str:
+    """Team abbreviation from a schedule matchup cell ('NYY' + noise -> 'NYY', 4-char -> 2)."""
+    return raw[:2] if len(raw) == 4 else raw[:2] + raw[3]
+
+
+def _parse_mlb_sched_page(text: str, year: str):
+    """
+    Parses one mlb.com/schedule page (which covers several days).
+
+    Args:
+        text (str): Page html.
+        year (str): Season year used to build 'YYYY-MM-DD' dates.
+
+    Returns:
+        list | None: One dict per day {'date', 'weekday', 'game_type', 'games'} where
+        games is a list of (home, away) pairs, or None if the scraped lists do not line up.
+    """
+    soup = BeautifulSoup(text, HTML_PARSER)
+    index = _sched_class_index(soup)
+
+    weekdays = [i.text for i in index['weekday']]
+    types = [i.text if i.text else 'Regular' for i in index['game_type']]
+
+    game_dates = []
+    for d in index['date']:
+        parts = d.text.split(' ')
+        if len(parts) >= 2:
+            month, day = parts[0], parts[1]
+            if month in MONTH_DCT:
+                game_dates.append(f'{year}-{MONTH_DCT[month]}-{day.zfill(2)}')
+
+    games = []
+    for game_table in index['section']:
+        temp = []
+        for game in (i.text for i in _SCHED_MATCHUP_SEL.select(game_table)):
+            if '@' in game:
+                home, away = game.split('@')
+                temp.append((_sched_abbrev(home), _sched_abbrev(away)))
+        games.append(temp)
+
+    if not (len(weekdays) == len(game_dates) == len(games) == len(types)):
+        return None
+    return [{'date': game_dates[i], 'weekday': weekdays[i], 'game_type': types[i], 'games': games[i]}
+            for i in range(len(weekdays))]
+
+
 def grab_mlb_sched(start_dt: str, end_dt: str) -> list:
     """
     Scrapes the MLB schedule for a given date range.
-    
+
+    Pages are fetched concurrently over one keep-alive session. Each page covers
+    several days, so requests go out in waves spaced by the observed page span and
+    any date already covered by a previous page is never requested. Parsed days are
+    cached as JSON under DATA_PATH/cache/mlb_sched; cached days older than
+    MLB_SCHED_REFRESH_DAYS are reused on rerun.
+
     Args:
         start_dt (str): Start date in 'YYYY-MM-DD' format.
         end_dt (str): End date in 'YYYY-MM-DD' format.
-        
+
     Returns:
         list: List of dictionaries containing game details (date, weekday, type, home, away).
     """
-    # Collect URL dates
-    MLB_HEADERS = {'Connection': 'keep-alive', 'Accept': 'application/json', 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36'}
-    start_date = datetime.strptime(start_dt, '%Y-%m-%d').date()
-    end_date = datetime.strptime(end_dt, '%Y-%m-%d').date()
-    num = (end_date - start_date).days
-    dates = []
-    for i in range(0, num):
-        dt = start_date + timedelta(days=i)
-        if dt == end_date:
-            break
-        else:
-            dates.append(str(dt))
+    dates = np.arange(np.datetime64(start_dt), np.datetime64(end_dt), dtype='datetime64[D]').astype(str).tolist()
+
+    session = requests.Session()
+    session.headers.update(MLB_SCHED_HEADERS)
+
+    def fetch(dt):
+        try:
+            return dt, session.get('https://www.mlb.com/schedule/' + dt).text, None
+        except Exception as e:
+            return dt, None, e
 
     completed_dts = set()
-    lst = []
+    attempted = set()
+    days = {}   # date -> parsed day; first page to report a day wins
+    span = 1    # days covered per page, learned from the first responses
+
+    # Past days are final: load them from the per-day cache and never re-request.
+    final_before = str(date.today() - timedelta(days=MLB_SCHED_REFRESH_DAYS))
     for dt in dates:
-        if dt not in completed_dts:
-            # Give the program a nap.
-            time.sleep(0.5)
-            # Collect the html.
+        path = os.path.join(MLB_SCHED_CACHE_DIR, f'{dt}.json')
+        if dt < final_before and os.path.exists(path):
             try:
-                response = requests.get('https://www.mlb.com/schedule/' + dt, headers=MLB_HEADERS)
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # Collect the table information.
-                # Note: Class names are hashed and likely brittle. 
-                # Ideally, this should be robustified or allow for dynamic class finding if possible.
-                # Keeping original logic for now as requested.
-                weekdays = [i.text for i in soup.find_all('div', attrs={'class': "ScheduleCollectionGridstyle__DateLabel-sc-c0iua4-5 iaVuoa"})]
-                types = [i.text if i.text else 'Regular' for i in soup.find_all('div', attrs={'class': "ScheduleCollectionGridstyle__GameTypeLabel-sc-c0iua4-6 dTLQcW"})]
-
-                game_dates = []
-                for d in soup.find_all('div', attrs={'class': "ScheduleCollectionGridstyle__DateLabel-sc-c0iua4-5 fQIzmH"}):
-                    parts = d.text.split(' ')
-                    if len(parts) >= 2:
-                        month, date = parts[0], parts[1]
-                        if month in MONTH_DCT:
-                            str_date = f'2025-{MONTH_DCT[month]}-{date.zfill(2)}'
-                            completed_dts.add(str_date)
-                            game_dates.append({'date': str_date})
-
-                games = []
-                for game_table in soup.find_all('div', attrs={'class':"ScheduleCollectionGridstyle__SectionWrapper-sc-c0iua4-0 guIOQi"}):
-                    daily_game_lst = game_table.find_all('div', attrs={'class':"TeamMatchupLayerstyle__TeamMatchupLayerWrapper-sc-ouprud-0 gQznxP teammatchup-teaminfo"})
-                    daily_game_lst = [i.text for i in daily_game_lst]
-                    temp = []
-                    for game in daily_game_lst:
-                        if '@' in game:
-                            home, away = game.split('@')
-                            # OK, Clean it up.
-                            if len(home) == 4:
-                                home = home[0] + home[1]
-                            else:
-                                home = home[0] + home[1] + home[3]
-
-                            if len(away) == 4:
-                                away = away[0] + away[1]
-                            else:
-                                away = away[0] + away[1] + away[3]
-                                
-                            temp.append({'home': home, 'away': away})
-                    games.append(temp)
-
-                # Link the elements.
-                if len(weekdays) == len(game_dates) and len(weekdays) == len(games):
-                    for i, j in enumerate(weekdays):
-                        d = {'date': game_dates[i]['date'], 'weekday': weekdays[i], 'game_type': types[i]}
-                        for v in games[i]:
-                            lst.append(dict(d)| v)
-                else:
+                with open(path, 'rb') as f:
+                    days[dt] = _json_loads(f.read())
+            except (OSError, ValueError) as e:
+                print(f"Warning: unreadable schedule cache for {dt} ({e}). Re-fetching.")
+                continue
+            completed_dts.add(dt)
+    with ThreadPoolExecutor(max_workers=MLB_SCHED_WORKERS) as ex:
+        while True:
+            pending = [dt for dt in dates if dt not in completed_dts and dt not in attempted]
+            if not pending:
+                break
+            # The first request runs alone so the page span is known before fanning out.
+            size = MLB_SCHED_WORKERS if attempted else 1
+            wave, last = [], None
+            for dt in pending:
+                day = date.fromisoformat(dt)
+                if last is None or (day - last).days >= span:
+                    wave.append(dt)
+                    last = day
+                    if len(wave) == size:
+                        break
+            attempted.update(wave)
+
+            # Fetch the wave concurrently, then parse.
+            for dt, text, err in ex.map(fetch, wave):
+                if err is not None:
+                    print(f"Error scraping {dt}: {err}")
+                    continue
+                try:
+                    parsed = _parse_mlb_sched_page(text, dt[:4])
+                except Exception as e:
+                    print(f"Error scraping {dt}: {e}")
+                    continue
+                if parsed is None:
                     print(f"Warning: Mismatch in scraped lists for {dt}. Skipping day.")
+                    continue
+                span = max(span, len(parsed))
+                for day in parsed:
+                    completed_dts.add(day['date'])
+                    if day['date'] not in days:
+                        days[day['date']] = day
+                        os.makedirs(MLB_SCHED_CACHE_DIR, exist_ok=True)
+                        path = os.path.join(MLB_SCHED_CACHE_DIR, f"{day['date']}.json")
+                        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                            json.dump(day, f)
+                        os.replace(path + '.tmp', path)
+                        # Tell me youre alive.
+                        print(f"Day completed ... ({day['date']})")
+            # Give the site a nap between waves.
+            time.sleep(0.5)
 
-                # Tell me youre alive.
-                for i in set(i['date'] for i in game_dates):
-                    print(f'Day completed ... ({i})')
-            except Exception as e:
-                print(f"Error scraping {dt}: {e}")
+    lst = [{'date': d['date'], 'weekday': d['weekday'], 'game_type': d['game_type'], 'home': home, 'away': away}
+           for d in (days[dt] for dt in sorted(days)) for home, away in d['games']]
 
     print(f'Number of games captured ... ({len(lst)})')
     return lst
 
+# ESPN sends stat ids as JSON object keys (strings); map them straight to names without int() per stat
+STATS_MAP_BY_KEY = {str(k): v for k, v in STATS_MAP.items()}
+
+SPLIT_TYPE_PERIODS = {1: 'last7days', 2: 'last15days', 3: 'last30days'}
+
+FREE_AGENT_JSON_FIELDS = ('fullName', 'id', 'defaultPositionId', 'eligibleSlots',
+                          'acquisitionType', 'proTeamId', 'injuryStatus')
+
+def _free_agent_fields(entry: dict, player: dict) -> dict:
+    """
+    Reads FREE_AGENT_JSON_FIELDS straight from their known kona_player_info paths
+    (entry -> player). Falls back to the generic json_extract_fields walk when the
+    entry does not have the expected shape.
+    """
+    if 'fullName' not in player:
+        return json_extract_fields(entry, FREE_AGENT_JSON_FIELDS)
+    return {
+        'fullName': player['fullName'],
+        'id': entry.get('id', player.get('id', [])),
+        'defaultPositionId': player.get('defaultPositionId', []),
+        'eligibleSlots': player.get('eligibleSlots', []),
+        'acquisitionType': entry.get('acquisitionType', player.get('acquisitionType', [])),
+        'proTeamId': player.get('proTeamId', []),
+        'injuryStatus': player.get('injuryStatus', []),
+    }
+
 def get_free_agents(league, position_ids=[14, 15], size=100):
     """
     Fetches top free agents for specific positions.
@@ -444,70 +692,84 @@ def get_free_agents(league, position_ids=[14, 15], size=100):
     Args:
         league (League): ESPN League object.
         position_ids (list): List of position IDs (e.g., [14, 15] for SP, RP).
-        size (int): Number of players to fetch.
+        size (int): Number of players to fetch per position ID.
         
     Returns:
-        list: List of processed free agent dictionaries.
+        list: List of processed free agent dictionaries (each player once).
     """
     params = {'view': 'kona_player_info', 'scoringPeriodId': league.current_week}
-    players = []
-    
-    for slot in position_ids:
+    position_ids = list(position_ids)
+
+    def fetch(slot_ids, limit):
         filters = {
             "players": {
                 "filterStatus": {"value": ["FREEAGENT", "WAIVERS"]},
-                "filterSlotIds": {"value": [slot]},
-                "limit": size,
+                "filterSlotIds": {"value": slot_ids},
+                "limit": limit,
                 "sortPercOwned": {"sortPriority": 1, "sortAsc": False},
                 "sortDraftRanks": {"sortPriority": 100, "sortAsc": True, "value": "STANDARD"}
             }
         }
         headers = {'x-fantasy-filter': json.dumps(filters)}
-        data = league.espn_request.league_get(params=params, headers=headers)
-        if 'players' in data:
-            players.extend(data['players'])
+        return league.espn_request.league_get(params=params, headers=headers).get('players', [])
+
+    # filterSlotIds takes several slots at once: one request covers every position
+    limit = size * len(position_ids)
+    players = fetch(position_ids, limit)
+
+    if len(position_ids) > 1:
+        # Keep the top `size` (by ownership) for each slot. A slot crowded out of a full
+        # combined page is topped up with its own request.
+        kept = {}
+        for slot in position_ids:
+            in_slot = [p for p in players
+                       if slot in (p.get('playerPoolEntry', {}).get('player') or p.get('player', {})).get('eligibleSlots', [])]
+            if len(in_slot) < size and len(players) >= limit:
+                in_slot = fetch([slot], size)
+            for p in in_slot[:size]:
+                kept.setdefault(p.get('id'), p)
+        players = list(kept.values())
             
+    pos_get, team_get, stat_get = POSITION_MAP.get, PRO_TEAM_MAP.get, STATS_MAP_BY_KEY.get
     free_agents = []
     for i in players:
-        name = json_parsing(i, 'fullName')
-        playerId = json_parsing(i, 'id')
-        position = POSITION_MAP.get(json_parsing(i, 'defaultPositionId') - 1, json_parsing(i, 'defaultPositionId') - 1)
-        lineupSlot = POSITION_MAP.get(i.get('lineupSlotId'), '')
+        player_entry = i.get('playerPoolEntry', {}).get('player') or i.get('player', {})
+        fields = _free_agent_fields(i, player_entry)
+        name = fields['fullName']
+        playerId = fields['id']
+        position = pos_get(fields['defaultPositionId'] - 1, fields['defaultPositionId'] - 1)
+        lineupSlot = pos_get(i.get('lineupSlotId'), '')
         
-        eligible_slots_raw = json_parsing(i, 'eligibleSlots')
-        eligibleSlots = [POSITION_MAP.get(pos, pos) for pos in eligible_slots_raw] if eligible_slots_raw else []
+        eligible_slots_raw = fields['eligibleSlots']
+        eligibleSlots = [pos_get(pos, pos) for pos in eligible_slots_raw] if eligible_slots_raw else []
         
-        acquisitionType = json_parsing(i, 'acquisitionType')
-        proTeamId = json_parsing(i, 'proTeamId')
-        proTeam = PRO_TEAM_MAP.get(proTeamId, proTeamId)
-        injuryStatus = json_parsing(i, 'injuryStatus')
+        acquisitionType = fields['acquisitionType']
+        proTeamId = fields['proTeamId']
+        proTeam = team_get(proTeamId, proTeamId)
+        injuryStatus = fields['injuryStatus']
         
         stats = {}
-        player_entry = i.get('playerPoolEntry', {}).get('player') or i.get('player', {})
         injured = player_entry.get('injured', False)
         research = player_entry.get('ownership', {})
         
         player_stats = player_entry.get('stats', [])
         for j in player_stats:
-            if j['statSplitTypeId'] == 1:
-                time_period = 'last7days'
-            elif j['statSplitTypeId'] == 2:
-                time_period = 'last15days'
-            elif j['statSplitTypeId'] == 3:
-                time_period = 'last30days'
-            elif j['statSplitTypeId'] == 0:
+            split = j['statSplitTypeId']
+            if split == 0:
                 if j['statSourceId'] == 0:
                     time_period = str(j['seasonId'])
                 else:
                     time_period = str(j['seasonId']) + 'Projected'
             else:
-                continue
+                time_period = SPLIT_TYPE_PERIODS.get(split)
+                if time_period is None:
+                    continue
 
             temp = {}
-            if 'stats' in j:
-                for k, v in j['stats'].items():
-                    if int(k) in STATS_MAP:
-                        temp[STATS_MAP[int(k)]] = v
+            for k, v in j.get('stats', {}).items():
+                stat_name = stat_get(k)
+                if stat_name is not None:
+                    temp[stat_name] = v
             stats[time_period] = temp
 
         free_agents.append({
@@ -525,6 +787,23 @@ def get_free_agents(league, position_ids=[14, 15], size=100):
         })
     return free_agents
 
+# get_league_rosters output column -> espn_api Player attribute
+ROSTER_PLAYER_FIELDS = {
+    'player_acquisition_type': 'acquisitionType',
+    'player_eligible_slots': 'eligibleSlots',
+    'player_injured': 'injured',
+    'player_injury_status': 'injuryStatus',
+    'player_lineup_slot': 'lineupSlot',
+    'player_name': 'name',
+    'player_id': 'playerId',
+    'player_position': 'position',
+    'player_pro_team': 'proTeam',
+    'player_projected_total_points': 'projected_total_points',
+    'player_total_points': 'total_points',
+}
+ROSTER_PLAYER_COLUMNS = tuple(ROSTER_PLAYER_FIELDS)
+_roster_player_getter = attrgetter(*ROSTER_PLAYER_FIELDS.values())
+
 def get_league_rosters(league, today_dt=None) -> list:
     """
     Fetches roster data for all teams in the league.
@@ -542,25 +821,32 @@ def get_league_rosters(league, today_dt=None) -> list:
     
     league_teams_players = []
     for team in league.teams:
-        for player in team.roster:
-            player_dct = {
-                'date': today_dt,
-                'team_id': team.team_id,
-                'player_acquisition_type': player.acquisitionType,
-                'player_eligible_slots': player.eligibleSlots,
-                'player_injured': player.injured,
-                'player_injury_status': player.injuryStatus,
-                'player_lineup_slot': player.lineupSlot,
-                'player_name': player.name,
-                'player_id': player.playerId,
-                'player_position': player.position,
-                'player_pro_team': player.proTeam,
-                'player_projected_total_points': player.projected_total_points,
-                'player_total_points': player.total_points,
-            }
-            league_teams_players.append(player_dct)
+        team_cols = {'date': today_dt, 'team_id': team.team_id}
+        league_teams_players.extend(team_cols | dict(zip(ROSTER_PLAYER_COLUMNS, _roster_player_getter(player)))
+                                    for player in team.roster)
     return league_teams_players
 
+# get_league_teams output column -> espn_api Team attribute, split around the owner columns
+TEAM_LEAD_FIELDS = {
+    'team_division_id': 'division_id',
+    'team_division_name': 'division_name',
+    'team_final_standing': 'final_standing',
+    'team_logo_url': 'logo_url',
+    'team_losses': 'losses',
+}
+TEAM_TAIL_FIELDS = {
+    'team_standing': 'standing',
+    'team_abbrev': 'team_abbrev',
+    'team_id': 'team_id',
+    'team_name': 'team_name',
+    'team_ties': 'ties',
+    'team_wins': 'wins',
+}
+TEAM_LEAD_COLUMNS = tuple(TEAM_LEAD_FIELDS)
+TEAM_TAIL_COLUMNS = tuple(TEAM_TAIL_FIELDS)
+_team_lead_getter = attrgetter(*TEAM_LEAD_FIELDS.values())
+_team_tail_getter = attrgetter(*TEAM_TAIL_FIELDS.values())
+
 def get_league_teams(league, today_dt=None) -> list:
     """
     Fetches metadata for all teams in the league.
@@ -577,25 +863,17 @@ def get_league_teams(league, today_dt=None) -> list:
         
     league_teams = []
     for team in league.teams:
-        team_dct = {
-            'date': today_dt,
-            'team_division_id': team.division_id,
-            'team_division_name': team.division_name,
-            'team_final_standing': team.final_standing,
-            'team_logo_url': team.logo_url,
-            'team_losses': team.losses,
-            'team_owner_display_name': team.owners[0]['displayName'] if team.owners else 'Unknown',
-            'team_owner_id': team.owners[0]['id'] if team.owners else 'Unknown',
-            'team_standing': team.standing,
-            'team_abbrev': team.team_abbrev,
-            'team_id': team.team_id,
-            'team_name': team.team_name,
-            'team_ties': team.ties,
-            'team_wins': team.wins
-        }
+        owner = team.owners[0] if team.owners else None
+        team_dct = {'date': today_dt}
+        team_dct.update(zip(TEAM_LEAD_COLUMNS, _team_lead_getter(team)))
+        team_dct['team_owner_display_name'] = owner['displayName'] if owner else 'Unknown'
+        team_dct['team_owner_id'] = owner['id'] if owner else 'Unknown'
+        team_dct.update(zip(TEAM_TAIL_COLUMNS, _team_tail_getter(team)))
         league_teams.append(team_dct)
     return league_teams
 
+LEAGUE_TRANSACTION_TYPES = frozenset({'ROSTER_ADD', 'ROSTER_DROP', 'TRADE_ACCEPTED'})
+
 def get_league_transactions(league):
     """
     Fetches and filters league communication logs for transactions (Adds, Drops, Trades).
@@ -624,19 +902,21 @@ def get_league_transactions(league):
             
         topics = comm_data.get('topics', [])
         
+        # Only transaction topics with at least one kept message pay for the timestamp conversion
         for topic in topics:
-            if topic['type'] == 'ACTIVITY_TRANSACTIONS':
-                date = datetime.fromtimestamp(topic['date']/1000)
-                messages = topic.get('messages', [])
-                for msg in messages:
-                    if msg['type'] in ('ROSTER_ADD', 'ROSTER_DROP', 'TRADE_ACCEPTED'):
-                        transaction_list.append({
-                            'date': date,
-                            'type': msg['type'],
-                            'targetId': msg.get('targetId'),
-                            'from': msg.get('from'),
-                            'to': msg.get('to')
-                        })
+            if topic['type'] != 'ACTIVITY_TRANSACTIONS':
+                continue
+            kept = [msg for msg in topic.get('messages', []) if msg['type'] in LEAGUE_TRANSACTION_TYPES]
+            if not kept:
+                continue
+            date = datetime.fromtimestamp(topic['date'] / 1000)
+            transaction_list.extend({
+                'date': date,
+                'type': msg['type'],
+                'targetId': msg.get('targetId'),
+                'from': msg.get('from'),
+                'to': msg.get('to')
+            } for msg in kept)
             
     except Exception as e:
         print(f"Error fetching transactions: {e}")
@@ -664,9 +944,9 @@ def fetch_mlb_transactions(start_date: str, end_date: str, sport_id: int = 1) ->
     
     print(f"Querying {url} with params {params}...")
     try:
-        response = requests.get(url, params=params)
+        response = _SESSION.get(url, params=params)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         return data.get("transactions", [])
     except Exception as e:
         print(f"Error querying MLB transactions API: {e}")
@@ -821,9 +1101,60 @@ def get_recent_activity(league, size=1000, msg_type=None, max_pages=10, since_ep
 
     return all_activity
 
+# SQLite page cache for immutable scraped HTML (e.g. completed-season leader pages)
+HTTP_CACHE_PATH = os.path.join(DATA_PATH, 'cache', 'http_cache.sqlite')
+
+def _open_http_cache():
+    """Opens (creating if needed) the SQLite page cache keyed by URL."""
+    os.makedirs(os.path.dirname(HTTP_CACHE_PATH), exist_ok=True)
+    con = sqlite3.connect(HTTP_CACHE_PATH)
+    con.execute('CREATE TABLE IF NOT EXISTS pages (url TEXT PRIMARY KEY, body TEXT NOT NULL, fetched_at TEXT NOT NULL)')
+    return con
+
+ESPN_HISTORY_PAGE_WORKERS = 4  # pages fetched concurrently per wave; kept small to stay polite
+
+def _get_pages_text(urls, headers, pool, cache=None):
+    """
+    GETs several pages concurrently, served from / stored in the SQLite page cache when one is given.
+    Only 200 responses are cached. The cache is read and written on the calling thread only.
+
+    Args:
+        urls (list): Page URLs (the cache keys).
+        headers (dict): Request headers.
+        pool (ThreadPoolExecutor): Executor used for the network fetches.
+        cache (sqlite3.Connection, optional): Connection from _open_http_cache().
+
+    Returns:
+        tuple: (list of (text or None on a non-200 response, exception or None) in url order,
+        whether any page had to be fetched over the network)
+    """
+    cached = {}
+    if cache is not None:
+        for url in urls:
+            row = cache.execute('SELECT body FROM pages WHERE url = ?', (url,)).fetchone()
+            if row:
+                cached[url] = row[0]
+
+    def fetch(url):
+        try:
+            response = _SESSION.get(url, headers=headers)
+        except Exception as e:
+            return None, e
+        return (response.text if response.status_code == 200 else None), None
+
+    missing = [url for url in urls if url not in cached]
+    fetched = dict(zip(missing, pool.map(fetch, missing)))
+    if cache is not None:
+        now = datetime.now().isoformat(timespec='seconds')
+        with cache:
+            cache.executemany('INSERT OR REPLACE INTO pages VALUES (?, ?, ?)',
+                              [(url, text, now) for url, (text, _) in fetched.items() if text is not None])
+    return [(cached[url], None) if url in cached else fetched[url] for url in urls], bool(missing)
+
 def scrape_espn_historical_stats(years=[2024], stat_types=['batting', 'pitching']):
     """
     Scrapes historical MLB player stats from ESPN.
+    Pages are requested in small concurrent waves and parsed in order, stopping at the last page.
     
     Args:
         years (list): List of years to scrape.
@@ -833,43 +1164,69 @@ def scrape_espn_historical_stats(years=[2024], stat_types=['batting', 'pitching'
         pandas.DataFrame: Consolidated stats DataFrame.
     """
     df_list = []
+    cache = _open_http_cache()
+    starts = list(range(1, 800, 40))  # page offsets
     
-    for year in years:
-        for stat_type in stat_types:
-            print(f"Scraping {stat_type} stats for {year}...")
-            if stat_type == 'batting':
-                base_url = f"https://www.espn.com/mlb/history/leaders/_/breakdown/season/year/{year}"
-            else:
-                base_url = f"https://www.espn.com/mlb/history/leaders/_/type/pitching/breakdown/season/year/{year}"
-                
-            for i in range(1, 800, 40): # Loop through pages
-                url = f"{base_url}/start/{i}"
-                try:
-                    response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'})
-                    if response.status_code == 200:
-                        # header=1 aligns perfectly with ESPN's layout for stats
-                        dfs = pd.read_html(io.StringIO(response.text), header=1)
+    with ThreadPoolExecutor(max_workers=ESPN_HISTORY_PAGE_WORKERS) as pool:
+        for year in years:
+            # Completed seasons never change: serve their pages from the on-disk cache
+            year_cache = cache if int(year) < date.today().year else None
+            for stat_type in stat_types:
+                print(f"Scraping {stat_type} stats for {year}...")
+                if stat_type == 'batting':
+                    base_url = f"https://www.espn.com/mlb/history/leaders/_/breakdown/season/year/{year}"
+                else:
+                    base_url = f"https://www.espn.com/mlb/history/leaders/_/type/pitching/breakdown/season/year/{year}"
+
+                done = False
+                for w in range(0, len(starts), ESPN_HISTORY_PAGE_WORKERS):
+                    urls = [f"{base_url}/start/{i}" for i in starts[w:w + ESPN_HISTORY_PAGE_WORKERS]]
+                    pages, fetched = _get_pages_text(urls, {'User-Agent': 'Mozilla/5.0'}, pool, year_cache)
+                    for text, err in pages:
+                        if err is not None:
+                            done = True
+                            break
+                        if text is None:
+                            continue
+                        try:
+                            # header=1 aligns perfectly with ESPN's layout for stats
+                            dfs = pd.read_html(io.StringIO(text), header=1)
+                        except Exception:
+                            done = True
+                            break
                         if dfs:
                             curr_df = dfs[0].copy()
                             # Avoid appending empty dfs or dfs without a player mapping
                             if curr_df.empty or 'PLAYER' not in curr_df.columns:
+                                done = True
                                 break
-                            
+
                             # Clean up intra-table headers ESPN injects periodically (it repeats the 'PLAYER' row)
                             curr_df = curr_df[curr_df['PLAYER'] != 'PLAYER'].copy()
                             if 'Unnamed: 0' in curr_df.columns:
                                 curr_df.rename(columns={'Unnamed: 0': 'RRANK'}, inplace=True)
-                            
+
+                            # The repeated header rows leave every column object-typed; restore numeric
+                            # dtypes per page so the concat below stacks numbers, not strings.
+                            for col in curr_df.columns.drop('PLAYER'):
+                                try:
+                                    curr_df[col] = pd.to_numeric(curr_df[col])
+                                except (ValueError, TypeError):
+                                    pass
+
                             curr_df['YEAR'] = year
                             curr_df['FILTER'] = stat_type
                             df_list.append(curr_df)
-                            
+
                             # If less than 40 rows returned, we reached the end of the query
                             if len(curr_df) < 40:
+                                done = True
                                 break
-                    time.sleep(0.5)
-                except Exception as e:
-                    break
+                    if done:
+                        break
+                    if fetched:
+                        time.sleep(0.5)
+    cache.close()
                 
     if df_list:
         final_df = pd.concat(df_list, ignore_index=True)
@@ -1000,6 +1357,8 @@ def get_top_fa_pitchers(league, size=200, min_ip=3.0):
         
     return sorted(pitchers, key=lambda x: x['era'])
 
+PITCHER_ELIGIBLE_SLOTS = frozenset({'SP', 'RP'})
+
 def analyze_roster_batters(league, team_id=2):
     """
     Analyzes consistency of batters on a specific roster.
@@ -1021,22 +1380,14 @@ def analyze_roster_batters(league, team_id=2):
         print(f"Team ID {team_id} not found.")
         return [], 0
 
-    my_batters = []
-    for i in my_team.roster:
-        is_p = False
-        for slot in i.eligibleSlots:
-            if slot in ('SP', 'RP'):
-                is_p = True
-        if not is_p:
-            my_batters.append(i)
-
-    my_batters_games = []
-    for p in my_batters:
-        my_batters_games.append({
-            'name': p.name, 
-            'position': p.eligibleSlots, 
-            'games': get_batter_game_logs(playerId=p.playerId, year=league.year)
-        })
+    my_batters = [p for p in my_team.roster if PITCHER_ELIGIBLE_SLOTS.isdisjoint(p.eligibleSlots)]
+
+    # One concurrent batch instead of a request per batter in sequence
+    logs = get_game_logs_batch([p.playerId for p in my_batters], year=league.year, category='batting')
+    my_batters_games = [
+        {'name': p.name, 'position': p.eligibleSlots, 'games': logs[p.playerId]}
+        for p in my_batters
+    ]
 
     all_did_something = 0
     games_totals = 0
@@ -1044,15 +1395,11 @@ def analyze_roster_batters(league, team_id=2):
     
     print("--- Batter Consistency ---")
     for i in my_batters_games:
-        did_something = 0
         total_games = len(i['games'])
-        
-        for j in i['games']:
-            if j.get('AB', 0) > 0:
-                if j.get('R', 0) == 0 and j.get('RBI', 0) == 0 and j.get('SB', 0) == 0 and j.get('HR', 0) == 0:
-                    pass
-                else:
-                    did_something += 1
+        # [game, (AB, R, RBI, SB, HR)]: a game counts if he batted and did any of R/RBI/SB/HR
+        a = np.array([[j.get(c, 0) for c in ('AB', 'R', 'RBI', 'SB', 'HR')] for j in i['games']],
+                     dtype=np.int32).reshape(total_games, 5)
+        did_something = int(((a[:, 0] > 0) & (a[:, 1:] != 0).any(axis=1)).sum())
         
         all_did_something += did_something
         games_totals += total_games
@@ -1066,6 +1413,78 @@ def analyze_roster_batters(league, team_id=2):
     
     return consistency_list, team_avg
 
+def fetch_scoring_period_data(league, scoring_period, matchup_period=None):
+    """
+    Fetches flattened per-player matchup rows for a single scoring period.
+
+    Args:
+        league (League): ESPN League object.
+        scoring_period (int): Scoring period (day) to fetch.
+        matchup_period (int, optional): Restrict to this matchup period; None for no filter.
+
+    Returns:
+        list: List of dictionaries containing flattened player stats ([] on request error).
+    """
+    params = {'view': ['mMatchupScore', 'mScoreboard'], 'scoringPeriodId': scoring_period}
+
+    # Only apply matchup filter if specific period provided
+    headers = {}
+    if matchup_period is not None:
+        filters = {"schedule": {"filterMatchupPeriodIds": {"value": [matchup_period]}}}
+        headers = {'x-fantasy-filter': json.dumps(filters)}
+
+    try:
+        data = league.espn_request.league_get(params=params, headers=headers)
+    except Exception as e:
+        print(f"  Error fetching SP {scoring_period}: {e}")
+        return []
+
+    pos_get, stat_get = POSITION_MAP.get, STATS_MAP_BY_KEY.get
+    rows = []
+    for i in data.get('schedule', []):
+        for side in ('away', 'home'):
+            if side not in i:
+                continue
+
+            team_data = i[side]
+            if 'rosterForCurrentScoringPeriod' not in team_data:
+                continue
+
+            entries = team_data.get('rosterForCurrentScoringPeriod', {}).get('entries', [])
+            for j in entries:
+                player_pool_entry = j.get('playerPoolEntry', {})
+                player = player_pool_entry.get('player', {})
+
+                lineup_slot_id = int(j.get('lineupSlotId', -1))
+                lineup_slot_name = pos_get(lineup_slot_id, str(lineup_slot_id))
+
+                entry_data = {
+                    'matchup_period': matchup_period,
+                    'scoring_period': scoring_period,
+                    'teamId': team_data.get('teamId'),
+                    'playerId': player.get('id'),
+                    'playerName': player.get('fullName'),
+                    'lineupSlot': lineup_slot_name,
+                    'b_or_p': 'batter' if lineup_slot_id not in (13, 14, 15) else 'pitcher'
+                }
+
+                if player.get('stats'):
+                    # Assuming stats[0] is the relevant one, as per notebook logic
+                    stats_source = player['stats'][0]
+                    stats_dict = stats_source.get('stats', {})
+
+                    # Capture Points
+                    entry_data['points'] = stats_source.get('appliedTotal', 0)
+
+                    for stat_id, stat_val in stats_dict.items():
+                        stat_name = stat_get(stat_id)
+                        if stat_name is not None:
+                            entry_data[stat_name] = stat_val
+
+                rows.append(entry_data)
+    print(f"  SP {scoring_period}: Found {len(rows)} records")
+    return rows
+
 def fetch_league_matchup_data(league, matchup_map):
     """
     Fetches detailed matchup data for the league.
@@ -1096,68 +1515,40 @@ def fetch_league_matchup_data(league, matchup_map):
         print(f"Processing (Matchup Filter: {matchup_period}) Sc. Periods: {scoring_periods}")
         
         for scoring_period in scoring_periods:
-            params = {'view': ['mMatchupScore', 'mScoreboard'], 'scoringPeriodId': scoring_period}
-            
-            # Only apply matchup filter if specific period provided
-            headers = {}
-            if matchup_period is not None:
-                filters = {"schedule": {"filterMatchupPeriodIds": {"value": [matchup_period]}}}
-                headers = {'x-fantasy-filter': json.dumps(filters)}
-            
-            try:
-                data = league.espn_request.league_get(params=params, headers=headers)
-            except Exception as e:
-                print(f"  Error fetching SP {scoring_period}: {e}")
-                continue
-                
-            schedule = data.get('schedule', [])
-            records_found = 0
+            data_list.extend(fetch_scoring_period_data(league, scoring_period, matchup_period))
 
-            for i in schedule:
-                for side in ('away', 'home'):
-                    if side not in i:
-                        continue
-                    
-                    team_data = i[side]
-                    if 'rosterForCurrentScoringPeriod' not in team_data:
-                        continue
-                        
-                    entries = team_data.get('rosterForCurrentScoringPeriod', {}).get('entries', [])
-                    for j in entries:
-                        player_pool_entry = j.get('playerPoolEntry', {})
-                        player = player_pool_entry.get('player', {})
-                        
-                        lineup_slot_id = int(j.get('lineupSlotId', -1))
-                        lineup_slot_name = POSITION_MAP.get(lineup_slot_id, str(lineup_slot_id))
-                        
-                        entry_data = {
-                            'matchup_period': matchup_period,
-                            'scoring_period': scoring_period,
-                            'teamId': team_data.get('teamId'),
-                            'playerId': player.get('id'),
-                            'playerName': player.get('fullName'),
-                            'lineupSlot': lineup_slot_name,
-                            'b_or_p': 'batter' if lineup_slot_id not in (13, 14, 15) else 'pitcher'
-                        }
-
-                        if player.get('stats'):
-                            # Assuming stats[0] is the relevant one, as per notebook logic
-                            stats_source = player['stats'][0]
-                            stats_dict = stats_source.get('stats', {})
-                            
-                            # Capture Points
-                            entry_data['points'] = stats_source.get('appliedTotal', 0)
-                            
-                            for stat_id, stat_val in stats_dict.items():
-                                if int(stat_id) in STATS_MAP:
-                                    entry_data[STATS_MAP[int(stat_id)]] = stat_val
-                        
-                        data_list.append(entry_data)
-                        records_found += 1
-            print(f"  SP {scoring_period}: Found {records_found} records")
-            
     return data_list, league_team_dict
 
+# espn_request per (league_id, year) for _cached_league_get, which can only take hashable args
+_LEAGUE_REQUESTS = {}
+
+@lru_cache(maxsize=32)
+def _cached_league_get(league_key, views, filter_json):
+    """Process-local cache of league_get responses keyed by (league key, views, x-fantasy-filter)."""
+    headers = {'x-fantasy-filter': filter_json} if filter_json else {}
+    return _LEAGUE_REQUESTS[league_key].league_get(params={'view': list(views)}, headers=headers)
+
+def league_get_cached(league, views, filters=None):
+    """
+    league_get for responses that are static within a session (settings, finished scoreboards).
+    Repeat calls with the same views and filters reuse the first response; see clear_league_cache.
+
+    Args:
+        league (League): ESPN League object.
+        views (tuple): ESPN view names, e.g. ('mSettings',).
+        filters (dict, optional): x-fantasy-filter payload.
+
+    Returns:
+        dict: Parsed league_get response (shared; do not mutate).
+    """
+    league_key = (league.league_id, league.year)
+    _LEAGUE_REQUESTS[league_key] = league.espn_request
+    return _cached_league_get(league_key, tuple(views), json.dumps(filters, sort_keys=True) if filters else None)
+
+def clear_league_cache():
+    """Drops every cached league_get response (e.g. to pick up live scoreboard changes)."""
+    _cached_league_get.cache_clear()
+
 def get_matchup_scoreboard(league, matchup_period=None):
     """
     Fetches the scoreboard (matchup results) for the league.
@@ -1169,43 +1560,33 @@ def get_matchup_scoreboard(league, matchup_period=None):
     Returns:
         list: List of matchup dictionaries (home_team, away_team, scores).
     """
-    params = {'view': ['mMatchupScore', 'mScoreboard']}
-    
     # If a specific period is requested, we can try to filter, but mScoreboard usually returns all.
     # We will filter in python if needed.
-    headers = {}
+    filters = None
     if matchup_period:
         filters = {"schedule": {"filterMatchupPeriodIds": {"value": [matchup_period]}}}
-        headers = {'x-fantasy-filter': json.dumps(filters)}
 
-    data = league.espn_request.league_get(params=params, headers=headers)
+    data = league_get_cached(league, ('mMatchupScore', 'mScoreboard'), filters)
     schedule = data.get('schedule', [])
-    
-    scoreboard = []
-    for match in schedule:
-        # Check if we should filter (if API didn't do it or if we want to be safe)
-        if matchup_period and match.get('matchupPeriodId') != matchup_period:
-            continue
-            
-        match_data = {
-            'matchupPeriodId': match.get('matchupPeriodId'),
-            'id': match.get('id'),
-            'winner': match.get('winner'),
-            'playoffTierType': match.get('playoffTierType'),
+    # Filter in python too, in case the API ignored the filter
+    if matchup_period:
+        schedule = [m for m in schedule if m.get('matchupPeriodId') == matchup_period]
+
+    scoreboard = [
+        {
+            'matchupPeriodId': m.get('matchupPeriodId'),
+            'id': m.get('id'),
+            'winner': m.get('winner'),
+            'playoffTierType': m.get('playoffTierType'),
+            'homeTeamId': (home := m.get('home', {})).get('teamId'),
+            'homeScore': home.get('totalPoints'),
+            'homeAdjustment': home.get('adjustment'),
+            'awayTeamId': (away := m.get('away', {})).get('teamId'),
+            'awayScore': away.get('totalPoints'),
+            'awayAdjustment': away.get('adjustment'),
         }
-        
-        home = match.get('home', {})
-        away = match.get('away', {})
-        
-        match_data['homeTeamId'] = home.get('teamId')
-        match_data['homeScore'] = home.get('totalPoints')
-        match_data['homeAdjustment'] = home.get('adjustment')
-        
-        match_data['awayTeamId'] = away.get('teamId')
-        match_data['awayScore'] = away.get('totalPoints')
-        match_data['awayAdjustment'] = away.get('adjustment')
-        
-        scoreboard.append(match_data)
+        for m in schedule
+    ]
         
     return scoreboard
 
@@ -1222,8 +1603,7 @@ def get_matchup_period_map(league):
     map_data = []
     
     # 1. Get Matchup Period -> Scoring Period ID mapping from Settings
-    params = {'view': 'mSettings'}
-    data = league.espn_request.league_get(params=params)
+    data = league_get_cached(league, ('mSettings',))
     
     mp_settings = {}
     if 'settings' in data and 'scheduleSettings' in data['settings']:
@@ -1316,9 +1696,77 @@ def get_draft_recap(league):
         
     return draft_results
 
+# Team category stats: counting stats are summed per period, rate stats averaged
+TEAM_SUM_STATS = ('R', 'HR', 'RBI', 'SB', 'QS', 'SVHD')
+TEAM_AVG_STATS = ('OPS', 'ERA', 'WHIP', 'K/9')
+TEAM_BATTER_STATS = ('R', 'HR', 'RBI', 'SB', 'OPS')
+TEAM_PITCHER_STATS = ('QS', 'ERA', 'WHIP', 'K/9', 'SVHD')
+
+TEAM_STATS = TEAM_SUM_STATS + TEAM_AVG_STATS
+_TEAM_AVG_MASK = np.array([s in TEAM_AVG_STATS for s in TEAM_STATS])
+
+def _team_period_arrays(data_list, period_col, team_ids=None):
+    """
+    Aggregates player rows into dense (team, period, stat) arrays.
+    Only active slots count (BE / IL excluded), batter stats only from batters and
+    pitcher stats only from pitchers. Stats follow TEAM_STATS order: counting stats
+    are summed per period, rate stats averaged; a period where a team had no
+    qualifying value for a stat gets 0.
+
+    Args:
+        data_list (list): Flattened player data from fetch_league_matchup_data.
+        period_col (str): 'matchup_period' or 'scoring_period'.
+        team_ids (list, optional): Keep only these teams, in this order (first-seen order otherwise).
+
+    Returns:
+        tuple: (team ids, periods, values (T, P, S) float array,
+        cells: (team index, period index) arrays of the (team, period) pairs that have
+        rows, in first-seen row order)
+    """
+    df = pd.DataFrame(data_list)
+    if df.empty:
+        teams = list(team_ids or [])
+        empty = np.zeros(0, dtype=int)
+        return teams, [], np.zeros((len(teams), 0, len(TEAM_STATS))), (empty, empty)
+
+    if team_ids is not None:
+        teams = list(team_ids)
+        df = df[df['teamId'].isin(teams)]
+        t = pd.Index(teams).get_indexer(df['teamId'])
+    else:
+        # Rows without a team can't be placed; factorize would tag them -1 and break bincount
+        df = df[df['teamId'].notna()]
+        t, teams = pd.factorize(df['teamId'])
+    p, periods = pd.factorize(df[period_col], use_na_sentinel=False)
+
+    # Non-numeric / blank values count as missing
+    vals = np.column_stack([pd.to_numeric(df[s], errors='coerce').to_numpy(dtype=float) if s in df
+                            else np.full(len(df), np.nan) for s in TEAM_STATS])
+    active = ~df['lineupSlot'].isin(('BE', 'IL')).to_numpy()
+    is_batter = active & (df['b_or_p'] == 'batter').to_numpy()
+    is_pitcher = active & (df['b_or_p'] == 'pitcher').to_numpy()
+    for si, s in enumerate(TEAM_STATS):
+        vals[~(is_batter if s in TEAM_BATTER_STATS else is_pitcher), si] = np.nan
+
+    # One bincount over the flattened (team, period, stat) index of every non-missing value.
+    # bincount adds in row order, so each cell's sum matches a sequential per-row sum.
+    shape = (len(teams), len(periods), len(TEAM_STATS))
+    size = shape[0] * shape[1] * shape[2]
+    rows, cols = np.nonzero(~np.isnan(vals))
+    flat = (t[rows] * shape[1] + p[rows]) * shape[2] + cols
+    sums = np.bincount(flat, weights=vals[rows, cols], minlength=size).reshape(shape)
+    counts = np.bincount(flat, minlength=size).reshape(shape)
+
+    pair = t * shape[1] + p
+    _, first = np.unique(pair, return_index=True)
+    cell = pair[np.sort(first)]
+    means = np.divide(sums, counts, out=np.zeros(shape), where=counts > 0)
+    return list(teams), list(periods), np.where(_TEAM_AVG_MASK, means, sums), (cell // shape[1], cell % shape[1])
+
 def calculate_team_aggregates(data_list, league_team_dict, period_type='weekly'):
     """
     Calculates team stats aggregated by week or day.
+    Stats are aggregated per period first, then averaged across the team's periods.
     
     Args:
         data_list (list): Flattened player data from fetch_league_matchup_data.
@@ -1328,89 +1776,23 @@ def calculate_team_aggregates(data_list, league_team_dict, period_type='weekly')
     Returns:
         list: List of dictionaries with aggregated stats per team.
     """
-    # Group data by Team -> Period
-    team_data = {tid: {} for tid in league_team_dict}
-    
-    # Define stats to aggregate
-    sum_stats = ('R', 'HR', 'RBI', 'SB', 'QS', 'SVHD')
-    avg_stats = ('OPS', 'ERA', 'WHIP', 'K/9')
-    all_stats = sum_stats + avg_stats
-
-    # Clean data (convert types)
-    cleaned_list = []
-    for row in data_list:
-        new_row = row.copy()
-        # Ensure stats are float/int or None
-        for stat in all_stats:
-            if stat in new_row and new_row[stat] != '':
-                try:
-                    new_row[stat] = float(new_row[stat])
-                except (ValueError, TypeError):
-                    new_row[stat] = None
-            else:
-                new_row[stat] = None
-        cleaned_list.append(new_row)
-
-    # Aggregation
-    for row in cleaned_list:
-        team_id = row['teamId']
-        if team_id not in team_data: 
-            continue # Should be initialized, but safety check
-            
-        period_key = row['matchup_period'] if period_type == 'weekly' else row['scoring_period']
-        
-        if period_key not in team_data[team_id]:
-            team_data[team_id][period_key] = {s: [] for s in all_stats}
-            
-        # Only include active slots (Notebook logic: excludes 'BE', 'IL')
-        if row['lineupSlot'] not in ('BE', 'IL'):
-            for stat in all_stats:
-                if row.get(stat) is not None:
-                    # Specific conditions from notebook (e.g. only batter stats if batter)
-                    # The notebook logic was a bit robust: it separated b/p stats
-                    if row['b_or_p'] == 'batter' and stat in ('R', 'HR', 'RBI', 'SB', 'OPS'):
-                        team_data[team_id][period_key][stat].append(row[stat])
-                    elif row['b_or_p'] == 'pitcher' and stat in ('QS', 'ERA', 'WHIP', 'K/9', 'SVHD'):
-                        team_data[team_id][period_key][stat].append(row[stat])
-                    
-                    # Logic adjustment: SVHD 0 fill if P/RP and 3 outs (from notebook)
-                    # This logic is complex to port without all context, simplified to straight aggregation for now
-                    # unless strictly required. Notebook logic:
-                    # if i['lineupSlot'] in ('P', 'RP') and 'OUTS' in i and i['OUTS'] == 3 ... 
-                    # We'll stick to basic aggregation for robustness unless requested otherwise.
+    period_col = 'matchup_period' if period_type == 'weekly' else 'scoring_period'
+    team_ids = list(league_team_dict)
+    _, _, values, (cell_t, cell_p) = _team_period_arrays(data_list, period_col, team_ids=team_ids)
 
-    # Calculate means/sums
+    # Average each team's period lines in the order its periods first appear, with
+    # Python sum/round, so the float additions and rounding ties match a row-by-row pass.
+    # Teams without any rows still get a (zeroed) line, in league_team_dict order.
+    team_periods = [[] for _ in team_ids]
+    for ti, pi in zip(cell_t.tolist(), cell_p.tolist()):
+        team_periods[ti].append(pi)
     final_output = []
-    for team_id, periods in team_data.items():
-        # If calculating weekly average stats across the season (as per notebook "Weekly Average Stats" block)
-        # We first aggregate per period, then average across periods
-        
-        # Temp list to hold period-level aggregates
-        team_period_aggregates = {s: [] for s in all_stats}
-        
-        for p_key, p_stats in periods.items():
-            for stat in sum_stats:
-                if p_stats[stat]:
-                    team_period_aggregates[stat].append(sum(p_stats[stat]))
-                else:
-                    team_period_aggregates[stat].append(0)
-            
-            for stat in avg_stats:
-                if p_stats[stat]:
-                    team_period_aggregates[stat].append(sum(p_stats[stat]) / len(p_stats[stat]))
-                else:
-                    team_period_aggregates[stat].append(0)
-        
-        # Now aggregate the periods into one final Team stat line
-        team_final = {'teamName': league_team_dict.get(team_id, f"Team {team_id}")}
-        for stat in all_stats:
-            vals = team_period_aggregates[stat]
-            if vals:
-                team_final[stat] = round(sum(vals) / len(vals), 2)
-            else:
-                team_final[stat] = 0.0
+    for ti, tid in enumerate(team_ids):
+        team_final = {'teamName': league_team_dict.get(tid, f"Team {tid}")}
+        lines = values[ti, team_periods[ti]].tolist()
+        for si, stat in enumerate(TEAM_STATS):
+            team_final[stat] = round(sum(line[si] for line in lines) / len(lines), 2) if lines else 0.0
         final_output.append(team_final)
-        
     return final_output
 
 def visualize_correlations(data_list, league_team_dict):
@@ -1423,44 +1805,37 @@ def visualize_correlations(data_list, league_team_dict):
     Returns:
         pandas.DataFrame: Correlation matrix.
     """
-    # We need to construct a DataFrame where each row is a Team-Day (or Team-Week) and columns are stats
-    # Re-using aggregation logic but keeping rows separate
-    
-    temp_data = [] # List of dicts
-    
-    # Group by Team & Scoring Period
-    grouped = {}
-    for row in data_list:
-        key = (row['teamId'], row['scoring_period'])
-        if key not in grouped:
-            grouped[key] = {s: [] for s in ('R', 'HR', 'RBI', 'SB', 'QS', 'SVHD', 'OPS', 'ERA', 'WHIP', 'K/9')}
-        
-        if row['lineupSlot'] not in ('BE', 'IL'):
-             if row['b_or_p'] == 'batter':
-                 for s in ('R', 'HR', 'RBI', 'SB', 'OPS'):
-                     if row.get(s) is not None: grouped[key][s].append(float(row[s]))
-             elif row['b_or_p'] == 'pitcher':
-                 for s in ('QS', 'SVHD', 'ERA', 'WHIP', 'K/9'):
-                     if row.get(s) is not None: grouped[key][s].append(float(row[s]))
-
-    for (tid, date), stats in grouped.items():
-        row_entry = {}
-        # Sums
-        for s in ('R', 'HR', 'RBI', 'SB', 'QS', 'SVHD'):
-            row_entry[s] = sum(stats[s]) if stats[s] else 0
-        # Avgs
-        for s in ('OPS', 'ERA', 'WHIP', 'K/9'):
-            row_entry[s] = sum(stats[s])/len(stats[s]) if stats[s] else 0
-            
-        temp_data.append(row_entry)
-
-    df = pd.DataFrame(temp_data)
+    # One row per Team-Day with summed counting stats and averaged rate stats
+    _, _, values, cells = _team_period_arrays(data_list, 'scoring_period')
+    df = pd.DataFrame(values[cells], columns=list(TEAM_STATS))
     if not df.empty:
         corr = df.corr().round(2)
         # To display: sb.heatmap(corr, cmap="Blues", annot=True)
         return corr
     return pd.DataFrame()
 
+_PITCHER_LOG_CACHE = {}  # (player_id, year) -> chronological game log
+
+def _cached_pitcher_game_logs(player_id, year):
+    """
+    Memoized get_pitcher_game_logs per (player, season), in chronological order
+    (the API lists newest first). Returns fresh row copies so callers cannot alter
+    the cache. Empty results are not cached, so a failed fetch is retried next call;
+    clear_pitcher_log_cache() forces a refresh.
+    """
+    key = (player_id, year)
+    log = _PITCHER_LOG_CACHE.get(key)
+    if log is None:
+        log = get_pitcher_game_logs(player_id=player_id, year=year)[::-1]
+        if not log:
+            return []
+        _PITCHER_LOG_CACHE[key] = log
+    return [dict(g) for g in log]
+
+def clear_pitcher_log_cache():
+    """Drops every memoized pitcher game log."""
+    _PITCHER_LOG_CACHE.clear()
+
 def perform_pitcher_regression(player_id, years=[2023, 2024]):
     """
     Performs OLS regression for a pitcher.
@@ -1472,19 +1847,10 @@ def perform_pitcher_regression(player_id, years=[2023, 2024]):
     Returns:
         dict: Regression results summary.
     """
-    def _add_constant(data):
-        if isinstance(data, (tuple, list)):
-            arr = np.ones((len(data), 2))
-        elif isinstance(data, np.ndarray):
-            arr = np.ones((data.shape[0], 2))
-        arr[:, 1] = data
-        return arr
-
     games = []
     for yr in years:
-        # Fetch and reverse to chronological order if needed (API returns usually desc)
-        log = get_pitcher_game_logs(player_id=player_id, year=yr)
-        games.extend(log[::-1])
+        # Cached logs are already in chronological order
+        games.extend(_cached_pitcher_game_logs(player_id, yr))
         
     if len(games) < 2:
         return {"error": "Not enough game data"}
@@ -1493,35 +1859,41 @@ def perform_pitcher_regression(player_id, years=[2023, 2024]):
     # Dependent Variable: ERA of the current game
     # Note: Notebook logic: x_data = ... [:-1], y_data = ... [1:]
     
-    x_vals = []
-    y_vals = []
-    
-    for i in range(len(games) - 1):
-        prev_game = games[i]
-        curr_game = games[i+1]
-        
-        tbf = prev_game.get('TBF', 0)
-        if tbf > 0:
-            k_rate = prev_game.get('K', 0) / tbf
-            bb_rate = prev_game.get('BB', 0) / tbf
-            val = k_rate - bb_rate
-            x_vals.append(val)
-            y_vals.append(curr_game.get('ERA', 0.0))
-            
-    if not x_vals:
+    tbf = np.array([g.get('TBF', 0) for g in games], dtype=float)
+    k = np.array([g.get('K', 0) for g in games], dtype=float)
+    bb = np.array([g.get('BB', 0) for g in games], dtype=float)
+    era = np.array([g.get('ERA', 0.0) for g in games], dtype=float)
+
+    # Pair each game with the next one; skip pairs whose earlier game faced no batters
+    valid = tbf[:-1] > 0
+    prev_tbf = tbf[:-1][valid]
+    x_data = k[:-1][valid] / prev_tbf - bb[:-1][valid] / prev_tbf
+    y_data = era[1:][valid]
+
+    if not x_data.size:
         return {"error": "No valid data points"}
-
-    x_data = np.array(x_vals)
-    y_data = np.array(y_vals)
     
-    # OLS
+    # OLS (y = b0 + b1 * x) solved directly; statistics match statsmodels' OLS results
+    # Degrees of freedom come from the design's rank (a constant x leaves rank 1), as in statsmodels
+    X = np.column_stack([np.ones_like(x_data), x_data])
+    n = X.shape[0]
     try:
-        model = regression.linear_model.OLS(y_data, _add_constant(x_data)).fit()
+        params, _, rank, _ = np.linalg.lstsq(X, y_data, rcond=None)
+        df_resid = n - rank
+        if df_resid <= 0:
+            return {"error": "Not enough data points for the regression"}
+        resid = y_data - X @ params
+        ssr = resid @ resid
+        with np.errstate(divide='ignore', invalid='ignore'):
+            bse = np.sqrt(np.diag(ssr / df_resid * np.linalg.pinv(X.T @ X)))
+            pvalues = 2 * scipy_stats.t.sf(np.abs(params / bse), df_resid)
+            rsquared = 1 - ssr / ((y_data - y_data.mean()) ** 2).sum()
+            llf = -n / 2 * (np.log(2 * np.pi) + np.log(ssr / n) + 1)
         return {
-            "rsquared": model.rsquared,
-            "params": model.params,
-            "pvalues": model.pvalues,
-            "aic": model.aic
+            "rsquared": rsquared,
+            "params": params,
+            "pvalues": pvalues,
+            "aic": -2 * llf + 2 * rank
         }
     except Exception as e:
         return {"error": str(e)}
@@ -1556,7 +1928,7 @@ def fetch_mlb_stats_page(group: str, season: int, player_pool: str, offset: int)
     for attempt in range(3):
         try:
             with urllib.request.urlopen(req, timeout=30) as resp:
-                return json.loads(resp.read().decode("utf-8"))
+                return _json_loads(resp.read())
         except (urllib.error.URLError, TimeoutError) as e:
             print(f"  [!] Attempt {attempt + 1} failed: {e}")
             time.sleep(2 ** attempt)
@@ -1710,14 +2082,14 @@ def scrape_mlb_lineups(date_str: str) -> list:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/133.0.0.0 Safari/537.36'
         }
-        response = requests.get(url, headers=headers, timeout=15)
+        response = _SESSION.get(url, headers=headers, timeout=15)
         if response.status_code != 200:
             return []
     except Exception as e:
         print(f"Error fetching global lineups for {date_str}: {e}")
         return []
         
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(response.text, HTML_PARSER)
     results = []
     
     # Each game is in a starting-lineups__matchup container
@@ -1789,6 +2161,26 @@ def scrape_mlb_lineups(date_str: str) -> list:
 
 # --- Analysis Utilities ---
 
+def read_csv(path):
+    """
+    Reads a data-lake CSV into a list of row dicts (BOM-safe, bad bytes replaced).
+
+    Args:
+        path (str): Path to the CSV file.
+
+    Returns:
+        list: One dict per row, keyed by header.
+    """
+    with open(path, encoding='utf-8-sig', errors='replace') as f:
+        return list(csv.DictReader(f))
+
+def to_float(v):
+    """Coerces a CSV cell to float, treating blanks and junk as 0.0."""
+    try:
+        return float(v)
+    except (TypeError, ValueError):
+        return 0.0
+
 def clean_name(name):
     """
     Normalize a player name by collapsing whitespace and removing
@@ -1888,12 +2280,60 @@ def add_daily_zscore(df, col, mask, sign=1.0):
         mask: Boolean mask selecting relevant rows (e.g. batters only).
         sign (float): +1.0 for positive stats, -1.0 for inverse stats.
     """
-    if col not in df.columns:
+    add_daily_zscores(df, {col: sign}, mask)
+
+
+def add_daily_zscores(df, col_signs, mask):
+    """
+    Add several z-score-normalized stat contributions to 'Daily_Value' at once.
+    Per-date means/stds for every column come from a single groupby.agg and are
+    broadcast back by date, instead of two transforms per column.
+
+    NOTE: Requires pandas DataFrame as input. Mutates df in place.
+
+    Args:
+        df (pd.DataFrame): DataFrame with a 'Daily_Value' column.
+        col_signs (dict): Stat column -> sign (+1.0 positive, -1.0 inverse).
+        mask: Boolean mask selecting relevant rows (e.g. batters only).
+    """
+    cols = [c for c in col_signs if c in df.columns]
+    if not cols:
         return
     sub = df.loc[mask]
-    dm = sub.groupby('date')[col].transform('mean')
-    ds = sub.groupby('date')[col].transform('std').replace(0, np.nan).fillna(1)
-    df.loc[mask, 'Daily_Value'] += sign * ((sub[col] - dm) / ds).fillna(0)
+    agg = sub.groupby('date')[cols].agg(['mean', 'std'])
+    dm = agg.xs('mean', axis=1, level=1).reindex(sub['date'])[cols].to_numpy()
+    ds = agg.xs('std', axis=1, level=1).replace(0, np.nan).fillna(1).reindex(sub['date'])[cols].to_numpy()
+    signs = np.array([col_signs[c] for c in cols], dtype=float)
+    z = np.nan_to_num((sub[cols].to_numpy(dtype=float) - dm) / ds, nan=0.0)
+    df.loc[mask, 'Daily_Value'] += z @ signs
+
+
+def grouped_zscores(X, starts):
+    """
+    Standardize each column of X within contiguous row groups (e.g. one group per date).
+    numpy-only counterpart of add_daily_zscores for the csv + numpy scripts.
+
+    Rows must already be sorted by group. Matches a per-group (x - mean) / std with
+    ddof=1, where single-row or constant groups use std = 1.
+
+    Args:
+        X (np.ndarray): 2-D array, rows sorted by group.
+        starts (np.ndarray): Row index where each group begins (starts[0] == 0).
+
+    Returns:
+        np.ndarray: Array shaped like X of within-group z-scores.
+    """
+    X = np.asarray(X, dtype=float)
+    if X.shape[0] == 0 or X.shape[1] == 0:
+        return X.copy()
+    counts = np.diff(np.append(starts, X.shape[0]))
+    rep = np.repeat(np.arange(len(starts)), counts)
+    mean = np.add.reduceat(X, starts, axis=0) / counts[:, None]
+    dev = X - mean[rep]
+    std = np.sqrt(np.add.reduceat(dev * dev, starts, axis=0) / np.maximum(counts - 1, 1)[:, None])
+    std[counts <= 1] = 1.0
+    std[std == 0] = 1.0
+    return dev / std[rep]
 
 
 def find_streaks(pid, player_df, streak_threshold=0.25, min_streak_len=5):
@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+mp = pytest.importorskip('fantasy_baseball.mlb_processing')
+
+
+def _row(team_id, runs):
+    return {'teamId': team_id, 'scoring_period': 1, 'lineupSlot': '1B', 'b_or_p': 'batter', 'R': runs}
+
+
+def test_team_period_arrays_skips_rows_without_team():
+    rows = [_row(1, 2), _row(None, 5), _row(1, 3)]
+
+    teams, periods, values, (cell_t, cell_p) = mp._team_period_arrays(rows, 'scoring_period')
+
+    assert teams == [1]
+    assert periods == [1]
+    assert values[0, 0, list(mp.TEAM_STATS).index('R')] == 5
+    assert list(cell_t) == [0] and list(cell_p) == [0]
+
+
+def test_visualize_correlations_with_null_team_row():
+    rows = [_row(1, 2), _row(None, 5), _row(2, 3)]
+    mp.visualize_correlations(rows, {1: 'AAA', 2: 'BBB'})